@@ -7,6 +7,7 @@ Bruger:
 - libs/registry.py for tag metadata og semantisk analyse
 """
 
+import os
 import re
 from libs.var import VariableStore, VarNode
 from libs.output import OutputNode
@@ -17,6 +18,54 @@ from libs.core import ActionNode as CoreActionNode, resolve_value, resolve_attri
 from libs.registry import TagRegistry, SemanticAnalyzer, TagCategory
 
 
+# Tegn med særlig betydning i regex - en literal prefix stopper ved dem
+_REGEX_META = set('.^$*+?{}[]|()\\')
+
+
+def _literal_prefix(pattern):
+    """
+    Find den literal tekst et regex pattern altid starter med, f.eks. '<window'
+    for r'<window\s+(.+)>$'. Ved top-level alternation (a|b) bruges den fælles
+    prefix af alternativerne. Returnerer '' hvis intet kan afgøres.
+    """
+    # Del pattern op i top-level alternativer
+    alternatives = []
+    depth = 0
+    in_class = False
+    start = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            i += 2
+            continue
+        if in_class:
+            if char == ']':
+                in_class = False
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            alternatives.append(pattern[start:i])
+            start = i + 1
+        i += 1
+    alternatives.append(pattern[start:])
+    
+    prefixes = []
+    for alternative in alternatives:
+        end = 0
+        while end < len(alternative) and alternative[end] not in _REGEX_META:
+            end += 1
+        # En quantifier efter prefixet kan gøre sidste tegn valgfrit
+        if end < len(alternative) and alternative[end] in '*?{':
+            end -= 1
+        prefixes.append(alternative[:max(end, 0)])
+    return os.path.commonprefix(prefixes)
+
+
 class ActionNode:
     """Base klasse for alle actions i PyTML action tree"""
     
@@ -30,13 +79,26 @@ class ActionNode:
     
     def add_child(self, child):
         """Tilføj et child - parent venter altid på children"""
+        if type(self.children) is tuple:
+            raise RuntimeError(f"Kan ikke tilføje child til frosset node <{self.tag_name}>")
         child.parent = self
         self.children.append(child)
         return child
     
+    def freeze(self):
+        """Frys children (rekursivt) til tuples når træet er færdigbygget"""
+        for child in self.children:
+            child_freeze = getattr(child, 'freeze', None)
+            if child_freeze is not None:
+                child_freeze()
+        self.children = tuple(self.children)
+    
     def children_ready(self):
         """Tjek om alle children er klar"""
-        return all(child.is_ready() for child in self.children)
+        for child in self.children:
+            if not child.is_ready():
+                return False
+        return True
     
     def is_ready(self):
         """En node er klar når den selv og alle children er færdige"""
@@ -508,7 +570,10 @@ class PyTMLCompiler:
         # Tilføj base parsere - VIGTIGT: object definitions først!
         parsers.extend(self._get_base_parsers())
         
-        return parsers
+        # Precompile alle patterns én gang - parse() kalder match direkte pr. linje.
+        # Den literal prefix bruges som billigt startswith-filter før regex forsøget.
+        return [(_literal_prefix(pattern), re.compile(pattern).match, handler)
+                for pattern, handler in parsers]
     
     def _get_base_parsers(self):
         """Base parsere for grundlæggende syntax"""
@@ -745,8 +810,10 @@ class PyTMLCompiler:
             
             # Prøv hver parser
             parsed = False
-            for pattern, handler in self._line_parsers:
-                match = re.match(pattern, line)
+            for prefix, matcher, handler in self._line_parsers:
+                if not line.startswith(prefix):
+                    continue
+                match = matcher(line)
                 if match:
                     result = handler(match, current, {
                         'variables': self.variables,
@@ -768,6 +835,9 @@ class PyTMLCompiler:
             if not parsed:
                 pass  # Kunne logge ukendte linjer
         
+        # Træet ændres ikke efter parse - children bliver til tuples
+        self.root.freeze()
+        
         return self.root
     
     def execute(self, gui_mode=False):
@@ -778,6 +848,7 @@ class PyTMLCompiler:
         """
         from libs.window import WindowStore
         
+        # 'windows' seedes altid her - window nodes antager at den findes
         context = {
             'variables': self.variables,
             'named_objects': self.named_objects,
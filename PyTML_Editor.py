@@ -323,8 +323,14 @@ class PyTMLEditor:
         gui_elem = getattr(element, '_gui_element', None)
         if gui_elem:
             # GUIElement mode - redraw canvas and sync to code
-            self.gui_editor.canvas.redraw_all()
-            self.gui_editor._sync_to_code()
+            if prop.name == 'name' and not self.gui_editor.canvas.reindex_element(gui_elem):
+                # reindex_element restored the old name - show it in the panel as well
+                rejected = prop.value
+                self.properties_panel.set_property_value(prop, gui_elem.name)
+                self.status_var.set(f"Name already in use: {rejected}")
+                return
+            self.gui_editor.canvas.redraw_element(gui_elem)
+            self.gui_editor.schedule_sync()
             self.status_var.set(f"Property updated: {prop.name}")
         else:
             # Code editor mode - update current line
@@ -618,6 +624,7 @@ class PyTMLEditor:
     def _save_to_file(self, filepath):
         """Save content to file"""
         try:
+            self.gui_editor.flush_sync()  # Include GUI edits that are still pending
             content = self.editor.get('1.0', tk.END)
             with open(filepath, 'w', encoding='utf-8') as f:
                 f.write(content)
@@ -627,6 +634,7 @@ class PyTMLEditor:
     
     def run_code(self):
         """Run PyTML code in a separate process"""
+        self.gui_editor.flush_sync()  # Include GUI edits that are still pending
         code = self.editor.get('1.0', tk.END)
         self.clear_output()
         
@@ -147,14 +147,18 @@ class ActionNode:
     - Property system integration
     """
     
+    # Faste instans-attributter (ingen per-instans __dict__).
+    # Subklasser uden egne __slots__ får stadig en __dict__.
+    __slots__ = ('tag_name', 'attributes', 'children', 'parent', '_ready', '_executed')
+    
     # Override i subklasser for at definere properties
     _properties: Dict[str, PropertyDescriptor] = {}
     
     # Override i subklasser for at definere metoder
     _methods: Dict[str, MethodDescriptor] = {}
     
-    # Metadata
-    tag_name: str = 'node'
+    # Metadata (tag_name sættes pr. instans i __init__)
+    tag_name: str
     is_gui_node: bool = False
     gui_type: str = None  # 'widget', 'container', 'action'
     
@@ -168,12 +172,24 @@ class ActionNode:
     
     def add_child(self, child: 'ActionNode') -> 'ActionNode':
         """Tilføj et child element"""
+        if type(self.children) is tuple:
+            raise RuntimeError(f"Kan ikke tilføje child til frosset node <{self.tag_name}>")
         child.parent = self
         self.children.append(child)
         return child
     
+    def freeze(self):
+        """Frys children (rekursivt) til tuples når træet er færdigbygget"""
+        for child in self.children:
+            child_freeze = getattr(child, 'freeze', None)
+            if child_freeze is not None:
+                child_freeze()
+        self.children = tuple(self.children)
+    
     def remove_child(self, child: 'ActionNode') -> bool:
         """Fjern et child element"""
+        if type(self.children) is tuple:
+            raise RuntimeError(f"Kan ikke fjerne child fra frosset node <{self.tag_name}>")
         if child in self.children:
             child.parent = None
             self.children.remove(child)
@@ -182,7 +198,10 @@ class ActionNode:
     
     def children_ready(self) -> bool:
         """Tjek om alle children er klar"""
-        return all(child.is_ready() for child in self.children)
+        for child in self.children:
+            if not child.is_ready():
+                return False
+        return True
     
     def is_ready(self) -> bool:
         """Tjek om denne node er klar"""
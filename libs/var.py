@@ -5,11 +5,88 @@ Inkluderer resolve_value() funktion til variabel-interpolation i alle libs
 """
 
 import re
+import functools
 
 from libs.core import ActionNode
 
 
-def resolve_value(value, context):
+# Precompilerede patterns til variabel-interpolation
+_TAG_RE = re.compile(r'<(\w+)_(\w+)>')
+_DOLLAR_RE = re.compile(r'\$(\w+)')
+
+# Suffix -> metodenavn på random generatorer (<rnd_random>, <rnd_float>)
+_RANDOM_METHOD_NAMES = {'random': 'random', 'float': 'random_float'}
+
+
+def _get_random_methods(context, name):
+    """
+    Hent dispatch dict (suffix -> bunden metode) for en navngiven random generator.
+    Slås op én gang pr. generator og caches i context['random_methods'].
+    """
+    random_methods = context.get('random_methods')
+    if random_methods is None:
+        random_methods = context['random_methods'] = {}
+    methods = random_methods.get(name)
+    if methods is None:
+        rng = context['randoms'][name]
+        methods = {}
+        for suffix, method_name in _RANDOM_METHOD_NAMES.items():
+            method = getattr(rng, method_name, None)
+            if method is not None:
+                methods[suffix] = method
+        random_methods[name] = methods
+    return methods
+
+
+def _replace_tag(context, variables, entries, randoms, match):
+    """Erstat et <name_suffix> match (context-opslag sendes ind som argumenter)"""
+    name = match.group(1)
+    suffix = match.group(2)
+    full_key = f"{name}_{suffix}"
+    
+    # First check if there's a callable in context with this exact key
+    if full_key in context:
+        ctx_value = context[full_key]
+        if callable(ctx_value):
+            return str(ctx_value())
+        return str(ctx_value)
+    
+    # Check randoms for random/float methods
+    if randoms and name in randoms:
+        method = _get_random_methods(context, name).get(suffix)
+        if method is not None:
+            return str(method())
+    
+    # If suffix is 'value', check entries and variables
+    if suffix == 'value':
+        # Check entries first
+        if entries and entries.get(name):
+            entry = entries.get(name)
+            return str(entry.get_value())
+        
+        # Check variables (bruger cachet string-form)
+        if variables:
+            var = variables.get(name)
+            if var is not None:
+                str_value = var.get_str_value()
+                if str_value is not None:
+                    return str_value
+    
+    return match.group(0)
+
+
+def _replace_dollar(variables, match):
+    """Erstat et $varname match"""
+    if variables:
+        var = variables.get(match.group(1))
+        if var is not None:
+            str_value = var.get_str_value()
+            if str_value is not None:
+                return str_value
+    return match.group(0)
+
+
+def resolve_value(value, context, _coerce_numeric=True):
     """
     Resolver en værdi der kan indeholde variabel-referencer.
     
@@ -24,6 +101,9 @@ def resolve_value(value, context):
     Args:
         value: Værdien der skal resolves (string, int, list, etc.)
         context: PyTML context dict med 'variables' key
+        _coerce_numeric: Konverter resultatet til int/float hvis muligt
+            (False når kalderen alligevel vil have en string). Gælder kun
+            en enkelt værdi - elementer i en liste konverteres altid.
     
     Returns:
         Den resolvede værdi
@@ -39,6 +119,12 @@ def resolve_value(value, context):
     if not isinstance(value, str):
         return value
     
+    # Ingen referencer i strengen - intet at erstatte (billig C-level scan)
+    has_tag = '<' in value
+    has_dollar = '$' in value
+    if not has_tag and not has_dollar:
+        return value
+    
     variables = context.get('variables')
     entries = context.get('entries')
     randoms = context.get('randoms')
@@ -46,59 +132,15 @@ def resolve_value(value, context):
     result = value
     
     # Pattern 1: <name_suffix> syntax - handles value, random, float, etc.
-    tag_pattern = r'<(\w+)_(\w+)>'
-    
-    def replace_tag(match):
-        name = match.group(1)
-        suffix = match.group(2)
-        full_key = f"{name}_{suffix}"
-        
-        # First check if there's a callable in context with this exact key
-        if full_key in context:
-            ctx_value = context[full_key]
-            if callable(ctx_value):
-                return str(ctx_value())
-            return str(ctx_value)
-        
-        # Check randoms for random/float methods
-        if randoms and name in randoms:
-            rng = randoms[name]
-            if suffix == 'random' and hasattr(rng, 'random'):
-                return str(rng.random())
-            elif suffix == 'float' and hasattr(rng, 'random_float'):
-                return str(rng.random_float())
-        
-        # If suffix is 'value', check entries and variables
-        if suffix == 'value':
-            # Check entries first
-            if entries and entries.get(name):
-                entry = entries.get(name)
-                return str(entry.get_value())
-            
-            # Check variables
-            if variables:
-                var_value = variables.get_value(name)
-                if var_value is not None:
-                    return str(var_value)
-        
-        return match.group(0)
-    
-    result = re.sub(tag_pattern, replace_tag, result)
+    if has_tag:
+        result = _TAG_RE.sub(functools.partial(_replace_tag, context, variables, entries, randoms), result)
     
     # Pattern 2: $varname syntax
-    dollar_pattern = r'\$(\w+)'
-    
-    def replace_dollar(match):
-        var_name = match.group(1)
-        if variables:
-            var_value = variables.get_value(var_name)
-            return str(var_value) if var_value is not None else match.group(0)
-        return match.group(0)
-    
-    result = re.sub(dollar_pattern, replace_dollar, result)
+    if '$' in result:
+        result = _DOLLAR_RE.sub(functools.partial(_replace_dollar, variables), result)
     
     # Hvis hele strengen blev erstattet med et tal, konverter
-    if result != value:
+    if _coerce_numeric and result != value:
         try:
             if '.' in result:
                 return float(result)
@@ -114,7 +156,7 @@ def resolve_as_string(value, context):
     Resolver en værdi og returner ALTID som string.
     Bruges til GUI tekst felter hvor vi vil vise tal som tekst.
     """
-    resolved = resolve_value(value, context)
+    resolved = resolve_value(value, context, _coerce_numeric=False)
     if resolved is None:
         return ''
     return str(resolved)
@@ -125,12 +167,26 @@ def resolve_as_int(value, context, default=0):
     Resolver en værdi og returner ALTID som int.
     Bruges til positions, størrelser osv.
     """
+    # Hurtig vej: allerede et tal eller en ren heltals-string ("42", "-3")
+    value_type = type(value)
+    if value_type is int:
+        return value
+    if value_type is float:
+        try:
+            return int(value)
+        except (ValueError, OverflowError):
+            return default  # NaN / inf, f.eks. fra inf - inf i en <math> linje
+    if value_type is str and value:
+        digits = value[1:] if value[0] in '+-' else value
+        if digits.isdecimal():
+            return int(value)
+    
     resolved = resolve_value(value, context)
     if resolved is None:
         return default
     try:
         return int(float(resolved))
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, OverflowError):
         return default
 
 
@@ -138,6 +194,16 @@ def resolve_as_float(value, context, default=0.0):
     """
     Resolver en værdi og returner ALTID som float.
     """
+    # Hurtig vej: tal, eller strings uden variabel-referencer (< eller $)
+    value_type = type(value)
+    if value_type is int or value_type is float:
+        return float(value)
+    if value_type is str and '<' not in value and '$' not in value:
+        try:
+            return float(value)
+        except ValueError:
+            return default
+    
     resolved = resolve_value(value, context)
     if resolved is None:
         return default
@@ -188,10 +254,12 @@ class Variable:
         self.children = []
         self.parent = None
         self._ready = False
+        self._str_cache = None
     
     def set_value(self, value):
         """Sæt værdien af variablen"""
         self.value = value
+        self._str_cache = None
         self._ready = True
         return self
     
@@ -199,6 +267,24 @@ class Variable:
         """Hent værdien af variablen"""
         return self.value
     
+    def get_str_value(self):
+        """
+        Hent værdien som string (til interpolation).
+        Strengen caches indtil næste set_value, så samme variabel
+        ikke stringificeres igen ved hver <x_value> reference.
+        """
+        cached = self._str_cache
+        if cached is not None:
+            return cached
+        value = self.value
+        if value is None:
+            return None
+        str_value = value if type(value) is str else str(value)
+        # Mutable værdier (lister osv.) kan ændres uden set_value - cache dem ikke
+        if not isinstance(value, (list, dict, set)):
+            self._str_cache = str_value
+        return str_value
+    
     def add_child(self, child):
         """Tilføj et child element"""
         child.parent = self
@@ -496,6 +582,53 @@ def evaluate_math(expression, context):
         raise ValueError(f"Kunne ikke evaluere '{expression}': {e}")
 
 
+def _to_number(value):
+    """Konverter en værdi til int/float (0 hvis det ikke er muligt)"""
+    if type(value) is int:
+        return value
+    try:
+        return float(value) if '.' in str(value) else int(value)
+    except:
+        return 0
+
+
+def _evaluate_math_value(value_expr, context):
+    """Evaluer value expression for en MathNode (falder tilbage til resolve_value)"""
+    try:
+        return evaluate_math(value_expr, context)
+    except:
+        return _to_number(resolve_value(value_expr, context))
+
+
+def _math_assign(current, value):
+    return value
+
+
+# Operator -> funktion(current, value) for MathNode
+_MATH_OPS = {
+    '=': _math_assign,
+    ':=': _math_assign,
+    '+=': lambda current, value: current + value,
+    'add': lambda current, value: current + value,
+    '-=': lambda current, value: current - value,
+    'sub': lambda current, value: current - value,
+    '*=': lambda current, value: current * value,
+    'mul': lambda current, value: current * value,
+    '/=': lambda current, value: current / value if value != 0 else 0,
+    'div': lambda current, value: current / value if value != 0 else 0,
+    '//=': lambda current, value: current // value if value != 0 else 0,
+    'floordiv': lambda current, value: current // value if value != 0 else 0,
+    '%=': lambda current, value: current % value if value != 0 else 0,
+    'mod': lambda current, value: current % value if value != 0 else 0,
+    '**=': lambda current, value: current ** value,
+    'pow': lambda current, value: current ** value,
+    '++': lambda current, value: current + 1,
+    'inc': lambda current, value: current + 1,
+    '--': lambda current, value: current - 1,
+    'dec': lambda current, value: current - 1,
+}
+
+
 class MathNode(ActionNode):
     """
     Math node - udfører matematik på variabler
@@ -508,9 +641,16 @@ class MathNode(ActionNode):
     """
     
     def execute(self, context):
-        var_name = self.attributes.get('var')
-        op = self.attributes.get('op', '=')
-        value_expr = self.attributes.get('value', '0')
+        """
+        Operator-funktion og (hvis udtrykket ikke indeholder referencer) selve
+        værdien beregnes ved første kørsel og gemmes i _math_spec. De genbruges
+        så længe var/op/value attributterne er uændrede - f.eks. <x_value++> i
+        en loop - og beregnes igen hvis attributterne redigeres.
+        """
+        attributes = self.attributes
+        var_name = attributes.get('var')
+        op = attributes.get('op', '=')
+        value_expr = attributes.get('value', '0')
         
         if not var_name:
             self._ready = True
@@ -521,53 +661,23 @@ class MathNode(ActionNode):
             self._ready = True
             return
         
-        # Hent nuværende værdi
-        current = variables.get_value(var_name)
-        if current is None:
-            current = 0
-        
-        # Evaluer value expression
-        try:
-            new_value = evaluate_math(value_expr, context)
-        except:
-            new_value = resolve_value(value_expr, context)
-            try:
-                new_value = float(new_value) if '.' in str(new_value) else int(new_value)
-            except:
-                new_value = 0
-        
-        # Konverter current til tal
-        try:
-            current = float(current) if '.' in str(current) else int(current)
-        except:
-            current = 0
+        spec = getattr(self, '_math_spec', None)
+        if spec is None or spec[0] != var_name or spec[1] != op or spec[2] != value_expr:
+            # Udtryk uden variabel-referencer giver altid samme værdi
+            is_constant = not (isinstance(value_expr, str) and ('<' in value_expr or '$' in value_expr))
+            constant_value = _evaluate_math_value(value_expr, context) if is_constant else None
+            spec = self._math_spec = (var_name, op, value_expr,
+                                      _MATH_OPS.get(op, _math_assign), is_constant, constant_value)
         
-        # Udfør operation
-        if op == '=' or op == ':=':
-            result = new_value
-        elif op == '+=' or op == 'add':
-            result = current + new_value
-        elif op == '-=' or op == 'sub':
-            result = current - new_value
-        elif op == '*=' or op == 'mul':
-            result = current * new_value
-        elif op == '/=' or op == 'div':
-            result = current / new_value if new_value != 0 else 0
-        elif op == '//=' or op == 'floordiv':
-            result = current // new_value if new_value != 0 else 0
-        elif op == '%=' or op == 'mod':
-            result = current % new_value if new_value != 0 else 0
-        elif op == '**=' or op == 'pow':
-            result = current ** new_value
-        elif op == '++' or op == 'inc':
-            result = current + 1
-        elif op == '--' or op == 'dec':
-            result = current - 1
+        _, _, _, op_func, is_constant, constant_value = spec
+        if is_constant:
+            new_value = constant_value
         else:
-            result = new_value
+            new_value = _evaluate_math_value(value_expr, context)
+        current = _to_number(variables.get_value(var_name))
         
         # Gem resultatet
-        variables.set(var_name, result)
+        variables.set(var_name, op_func(current, new_value))
         
         self._ready = True
         self._executed = True
@@ -11,8 +11,16 @@ Syntax:
     <wnd1_title="Ny Titel">
     <wnd1_size="400","500">
     <wnd1_backgroundcolor="#ff0000">
+
+Modulet er ren Python uden reflection- eller frame-tricks, så parser og
+action dispatch JIT-kompileres fint af PyPy. `pypy3 Main.py` er den
+anbefalede hurtige måde at køre GUI-tunge scripts på.
 """
 
+import re
+import sys
+from functools import lru_cache
+import types
 import tkinter as tk
 from tkinter import ttk
 
@@ -30,6 +38,10 @@ class Window:
     - Embedded surfaces (pygame via embed)
     """
     
+    __slots__ = ('name', 'title', 'width', 'height', 'visible', 'children', 'parent',
+                 '_ready', '_tk_window', '_widgets', '_canvas', '_embed_frame',
+                 '_backgroundcolor', '_pending', '_pending_after_id', '_last_geometry', '_last_title')
+    
     def __init__(self, name, title="PyTML Window", width=300, height=300):
         self.name = name
         self.title = title
@@ -44,13 +56,19 @@ class Window:
         self._canvas = None  # For canvas-based graphics
         self._embed_frame = None  # For embedding external surfaces
         self._backgroundcolor = None
+        self._pending = {}  # Ventende Tk opdateringer (title/geometry)
+        self._pending_after_id = None  # after_idle id for _flush_pending
+        self._last_geometry = None  # Sidst sendte geometry string til Tk
+        self._last_title = None  # Sidst sendte titel til Tk
     
     def _create_window(self):
         """Opret det faktiske tkinter vindue"""
         if self._tk_window is None:
             self._tk_window = tk.Toplevel()
-            self._tk_window.title(self.title)
-            self._tk_window.geometry(f"{self.width}x{self.height}")
+            self._last_title = self.title
+            self._last_geometry = f"{self.width}x{self.height}"
+            self._tk_window.title(self._last_title)
+            self._tk_window.geometry(self._last_geometry)
             self._tk_window.protocol("WM_DELETE_WINDOW", self.hide)
         return self._tk_window
     
@@ -127,23 +145,29 @@ class Window:
     def close(self):
         """Luk vinduet helt"""
         if self._tk_window:
+            self._cancel_pending()
             self._tk_window.destroy()
             self._tk_window = None
             self._canvas = None
             self._embed_frame = None
+        self._pending = {}
+        self._last_geometry = None
+        self._last_title = None
         self.visible = False
         return self
     
     def set_title(self, title):
         """Sæt vinduets titel"""
         self.title = title
-        if self._tk_window:
-            self._tk_window.title(title)
+        if self._tk_window and title != self._last_title:
+            self._last_title = title
+            self._schedule_update('title', title)
         return self
 
     def exit(self):
         """Kald destroy"""
         if self._tk_window:
+            self._cancel_pending()
             self._tk_window.destroy()
         return self
 
@@ -155,9 +179,45 @@ class Window:
         self.width = width
         self.height = height
         if self._tk_window:
-            self._tk_window.geometry(f"{self.width}x{self.height}")
+            # Spring Tk kaldet over hvis størrelsen ikke er ændret
+            geometry = f"{width}x{height}"
+            if geometry != self._last_geometry:
+                self._last_geometry = geometry
+                self._schedule_update('geometry', geometry)
         return self
     
+    def _schedule_update(self, key, value):
+        """
+        Sæt en Tk opdatering i kø. Title/geometry ændringer samles og
+        anvendes i ét hug via after_idle, så hurtige ændringer fra et
+        script kun giver én runde Tk kald pr. idle cyklus.
+        """
+        if not self._pending:
+            self._pending_after_id = self._tk_window.after_idle(self._flush_pending)
+        self._pending[key] = value
+    
+    def _cancel_pending(self):
+        """
+        Annuller en ventende _flush_pending før vinduet destroyes - ellers
+        kører Tcl idle scriptet mod en slettet callback kommando.
+        """
+        if self._pending_after_id is not None:
+            self._tk_window.after_cancel(self._pending_after_id)
+            self._pending_after_id = None
+        self._pending = {}
+    
+    def _flush_pending(self):
+        """Anvend alle ventende Tk opdateringer"""
+        self._pending_after_id = None
+        pending = self._pending
+        self._pending = {}
+        if self._tk_window is None:
+            return
+        if 'title' in pending:
+            self._tk_window.title(pending['title'])
+        if 'geometry' in pending:
+            self._tk_window.geometry(pending['geometry'])
+    
     def set_backgroundcolor(self, color):
         """Sæt vinduets baggrundsfarve"""
         self._backgroundcolor = color
@@ -175,7 +235,11 @@ class Window:
         """Tjek om vinduet og alle children er klar"""
         if not self._ready:
             return False
-        return all(child.is_ready() for child in self.children if hasattr(child, 'is_ready'))
+        for child in self.children:
+            child_is_ready = getattr(child, 'is_ready', None)
+            if child_is_ready is not None and not child_is_ready():
+                return False
+        return True
     
     def get_tk_window(self):
         """Hent det underliggende tkinter vindue"""
@@ -216,15 +280,15 @@ class WindowStore:
     
     def show(self, name):
         """Vis et vindue"""
-        window = self.get(name)
-        if window:
+        window = self.windows.get(name)
+        if window is not None:
             window.show()
         return window
     
     def hide(self, name):
         """Skjul et vindue"""
-        window = self.get(name)
-        if window:
+        window = self.windows.get(name)
+        if window is not None:
             window.hide()
         return window
     
@@ -257,11 +321,13 @@ class WindowNode(ActionNode):
     gui_type = "container"
     gui_category = "window"
     
-    def execute(self, context):
-        # Først udfør alle children
-        for child in self.children:
-            child.execute(context)
-        
+    # _is_static: ingen attributter indeholder variabel-referencer (afgøres ved første kørsel)
+    # _static_window: cachet (name, title, width, height, extras) for statiske vinduer
+    _is_static = None
+    _static_window = None
+    
+    def _resolve_window(self, context):
+        """Resolve attributter til (name, title, width, height, extras)"""
         # Resolve alle attributter med variabel-interpolation
         resolved = resolve_attributes(self.attributes, context)
         
@@ -276,17 +342,35 @@ class WindowNode(ActionNode):
         else:
             width = height = int(size)
         
+        # Alle ekstra attributter anvendes via set_* metoder
+        skip_attrs = {'name', 'title', 'size'}
+        extras = tuple((pytml_name, value) for pytml_name, value in resolved.items()
+                       if pytml_name not in skip_attrs)
+        return name, title, width, height, extras
+    
+    def execute(self, context):
+        # Først udfør alle children
+        for child in self.children:
+            child.execute(context)
+        
+        # Statiske vinduer resolves kun første gang
+        window_info = self._static_window
+        if window_info is None:
+            window_info = self._resolve_window(context)
+            is_static = self._is_static
+            if is_static is None:
+                is_static = self._is_static = _is_static_attributes(self.attributes)
+            if is_static:
+                self._static_window = window_info
+        name, title, width, height, extras = window_info
+        
         if name:
-            # Sørg for at windows store eksisterer
-            if 'windows' not in context:
-                context['windows'] = WindowStore()
+            # Runtime (PyTMLCompiler.execute) seeder altid context['windows']
+            assert 'windows' in context, "context mangler 'windows' store"
             window = context['windows'].create(name, title, width, height)
             
             # Anvend alle ekstra attributter via set_* metoder
-            skip_attrs = {'name', 'title', 'size'}
-            for pytml_name, value in resolved.items():
-                if pytml_name in skip_attrs:
-                    continue
+            for pytml_name, value in extras:
                 setter_name = f'set_{pytml_name}'
                 if hasattr(window, setter_name):
                     getattr(window, setter_name)(value)
@@ -295,6 +379,16 @@ class WindowNode(ActionNode):
         self._executed = True
 
 
+def _is_static_attributes(attributes):
+    """Tjek om ingen attribut-værdier indeholder variabel-referencer (< eller $)"""
+    for value in attributes.values():
+        values = value if isinstance(value, list) else (value,)
+        for item in values:
+            if isinstance(item, str) and ('<' in item or '$' in item):
+                return False
+    return True
+
+
 class WindowActionNode(ActionNode):
     """
     Window action nodes:
@@ -307,55 +401,81 @@ class WindowActionNode(ActionNode):
         action = self.attributes.get('action')
         raw_value = self.attributes.get('value')
         
-        if 'windows' not in context:
-            self._ready = True
-            self._executed = True
-            return
-        
+        # Runtime (PyTMLCompiler.execute) seeder altid context['windows']
+        assert 'windows' in context, "context mangler 'windows' store"
         window = context['windows'].get(name)
         if not window:
             self._ready = True
             self._executed = True
             return
         
-        if action == 'show':
-            window.show()
-        elif action == 'hide':
-            window.hide()
-        elif action == 'close':
-            window.close()
-        elif action == 'title':
-            # Brug resolve_as_string for at håndtere tal som tekst
-            title_value = resolve_as_string(raw_value, context)
-            window.set_title(title_value)
-        elif action == 'size':
-            value = resolve_value(raw_value, context)
-            if isinstance(value, list):
-                window.set_size(int(value[0]), int(value[1]) if len(value) > 1 else None)
-            else:
-                window.set_size(int(value))
+        handler = _WINDOW_ACTIONS.get(action)
+        if handler is not None:
+            handler(window, raw_value, context)
         
         self._ready = True
         self._executed = True
 
 
+def _action_title(window, raw_value, context):
+    """<wnd1_title="..."> - brug resolve_as_string for at håndtere tal som tekst"""
+    window.set_title(resolve_as_string(raw_value, context))
+
+
+def _action_size(window, raw_value, context):
+    """<wnd1_size="300","350"> eller <wnd1_size="300">"""
+    value = resolve_value(raw_value, context)
+    if isinstance(value, list):
+        window.set_size(int(value[0]), int(value[1]) if len(value) > 1 else None)
+    else:
+        window.set_size(int(value))
+
+
+# Action navn -> handler(window, raw_value, context)
+_WINDOW_ACTIONS = {
+    'show': lambda window, raw_value, context: window.show(),
+    'hide': lambda window, raw_value, context: window.hide(),
+    'close': lambda window, raw_value, context: window.close(),
+    'title': _action_title,
+    'size': _action_size,
+}
+
+
+# Stack argumenter: "300","350"
+_STACK_RE = re.compile(r'"([^"]*)"')
+
+# Window attributter: key="value", key="a","b" (stack) eller key=<var_value>
+# Gruppe 2 er første quoted værdi, gruppe 3 resten af en eventuel stack
+_ATTR_RE = re.compile(r'(\w+)=(?:"([^"]*)"((?:\s*,\s*"[^"]*")*)|(<\w+_value>))')
+
+
+@lru_cache(maxsize=512)
+def _parse_stack_args_cached(arg_string):
+    """Memoiseret parsing af stack argumenter (tuple, så cachen ikke kan muteres)"""
+    matches = _STACK_RE.findall(arg_string)
+    return tuple(matches) if matches else (arg_string,)
+
+
 def parse_stack_args(arg_string):
     """
     Parse stack argumenter (komma-separerede værdier i quotes)
     "300","350" -> [300, 350]
     "300" -> [300]
+    
+    Gentagne argument-strenge (f.eks. size="300","200") slås op i en cache;
+    der returneres altid en ny liste, da resultatet gemmes i node attributter.
     """
-    import re
-    matches = re.findall(r'"([^"]*)"', arg_string)
-    return matches if matches else [arg_string]
+    return list(_parse_stack_args_cached(arg_string))
 
 
 def get_line_parsers():
     """Returner linje parsere for window modulet"""
     return [
         # <window title="Test" size="300","350" name="wnd1">
-        # Bruger greedy match til sidste > på linjen for at håndtere nested <var_value>
-        (r'<window\s+(.+)>$', _parse_window_declaration),
+        # Bruger greedy match til sidste > på linjen for at håndtere nested <var_value>.
+        # Præcis ét \s foran gruppen: ekstra mellemrum havner i gruppen, så \s+ og .+
+        # ikke kan dele mellemrum imellem sig (undgår O(n²) backtracking uden afsluttende >)
+        (r'<window\s(.+)>$', _parse_window_declaration_match),
         # <wnd1_show>
         (r'<(\w+)_show>', _parse_window_show),
         # <wnd1_hide>
@@ -366,128 +486,116 @@ def get_line_parsers():
         # Tillader valgfrit mellemrum før =
         (r'<(\w+)_title\s*=\s*"(<[^>]+>)">', _parse_window_title_var),  # Med nested tag i quotes
         (r'<(\w+)_title\s*=\s*(<\w+_value>)>', _parse_window_title_ref),  # Med direkte variabel ref
-        (r'<(\w+)_title\s*=\s*"([^"]*)">', _parse_window_title),  # Med literal string
+        (r'<(\w+)_title\s*=\s*"([^"]*)">', _parse_window_title_literal),  # Med literal string
         # <wnd1_size="300","350"> eller <wnd1_size="300">
-        (r'<(\w+)_size=(.+)>$', _parse_window_size),
+        (r'<(\w+)_size=(.+)>$', _parse_window_size_match),
     ]
 
 
-def _parse_window_declaration(match, current, context):
+def _parse_window_declaration_match(match, current, context):
     """
     Parse <window title="Test" size="300","350" name="wnd1" backgroundcolor="#ff0000">
     Understøtter alle attributter dynamisk
     """
-    import re
-    attrs_str = match.group(1)
-    
-    attributes = {}
-    
-    # Parse alle key="value" eller key=<var_value> attributter generisk
-    # Matcher: key="value" eller key=<var_value>
-    attr_pattern = r'(\w+)=(?:"([^"]*)"|(<\w+_value>))'
-    for attr_match in re.finditer(attr_pattern, attrs_str):
-        key = attr_match.group(1)
-        if attr_match.group(2) is not None:
-            value = attr_match.group(2)
-            # Special handling for size som kan være "300","200"
-            if key == 'size':
-                value = parse_stack_args(f'"{value}"')
-        else:
-            value = attr_match.group(3)  # Gem som <var_value> for resolve
-        attributes[key] = value
-    
-    node = WindowNode('window', attributes)
-    current.add_child(node)
-    return None
+    _parse_window_declaration(match.group(1), current)
 
 
 def _parse_window_show(match, current, context):
     """Parse <wnd1_show>"""
-    window_name = match.group(1)
-    node = WindowActionNode('window_action', {
-        'window_name': window_name,
-        'action': 'show'
-    })
-    current.add_child(node)
-    return None
+    _parse_window_action(match.group(1), 'show', current)
 
 
 def _parse_window_hide(match, current, context):
     """Parse <wnd1_hide>"""
-    window_name = match.group(1)
-    node = WindowActionNode('window_action', {
-        'window_name': window_name,
-        'action': 'hide'
-    })
-    current.add_child(node)
-    return None
+    _parse_window_action(match.group(1), 'hide', current)
 
 
 def _parse_window_close(match, current, context):
     """Parse <wnd1_close>"""
-    window_name = match.group(1)
-    node = WindowActionNode('window_action', {
-        'window_name': window_name,
-        'action': 'close'
-    })
-    current.add_child(node)
-    return None
+    _parse_window_action(match.group(1), 'close', current)
 
 
-def _parse_window_title(match, current, context):
+def _parse_window_title_literal(match, current, context):
     """Parse <wnd1_title="literal">"""
-    window_name = match.group(1)
-    title = match.group(2)
-    node = WindowActionNode('window_action', {
-        'window_name': window_name,
-        'action': 'title',
-        'value': title
-    })
-    current.add_child(node)
-    return None
+    _parse_window_title(match.group(1), match.group(2), current)
 
 
 def _parse_window_title_var(match, current, context):
     """Parse <wnd1_title ="<ent1_value>"> - nested tag i quotes"""
-    window_name = match.group(1)
-    title = match.group(2)  # F.eks. <ent1_value>
+    _parse_window_title(match.group(1), match.group(2), current)
+
+
+def _parse_window_title_ref(match, current, context):
+    """Parse <wnd1_title=<var_value>> - direkte variabel reference"""
+    _parse_window_title(match.group(1), match.group(2), current)
+
+
+def _parse_window_size_match(match, current, context):
+    """Parse <wnd1_size="300","350">"""
+    _parse_window_size(match.group(1), match.group(2), current)
+
+
+def _parse_window_declaration(attrs_str, current):
+    """
+    Parse <window title="Test" size="300","350" name="wnd1" backgroundcolor="#ff0000">
+    Understøtter alle attributter dynamisk
+    """
+    attributes = {}
+    
+    # Parse alle key="value" eller key=<var_value> attributter generisk
+    # Nøgler (og vinduesnavnet) interneres, da de bruges som dict keys ved execute
+    for attr_match in _ATTR_RE.finditer(attrs_str):
+        key = sys.intern(attr_match.group(1))
+        value, stack_rest, ref = attr_match.group(2, 3, 4)
+        if value is not None:
+            # Special handling for size som kan være "300","200"
+            if key == 'size':
+                value = parse_stack_args(f'"{value}"{stack_rest}')
+        else:
+            value = ref  # Gem som <var_value> for resolve
+        if key == 'name':
+            value = sys.intern(value)
+        attributes[key] = value
+    
+    node = WindowNode('window', attributes)
+    current.add_child(node)
+
+
+def _parse_window_action(window_name, action, current):
+    """Parse <wnd1_show>, <wnd1_hide> og <wnd1_close>"""
     node = WindowActionNode('window_action', {
-        'window_name': window_name,
-        'action': 'title',
-        'value': title
+        'window_name': sys.intern(window_name),
+        'action': action
     })
     current.add_child(node)
-    return None
 
 
-def _parse_window_title_ref(match, current, context):
-    """Parse <wnd1_title=<var_value>> - direkte variabel reference"""
-    window_name = match.group(1)
-    title = match.group(2)  # F.eks. <titlevar_value>
+def _parse_window_title(window_name, title, current):
+    """
+    Parse <wnd1_title="literal">, <wnd1_title ="<ent1_value>"> (nested tag i quotes)
+    og <wnd1_title=<var_value>> (direkte variabel reference)
+    """
     node = WindowActionNode('window_action', {
-        'window_name': window_name,
+        'window_name': sys.intern(window_name),
         'action': 'title',
         'value': title
     })
     current.add_child(node)
-    return None
 
 
-def _parse_window_size(match, current, context):
+def _parse_window_size(window_name, size_str, current):
     """Parse <wnd1_size="300","350">"""
-    window_name = match.group(1)
-    size_str = match.group(2)
     size_values = parse_stack_args(size_str)
     node = WindowActionNode('window_action', {
-        'window_name': window_name,
+        'window_name': sys.intern(window_name),
         'action': 'size',
         'value': size_values
     })
     current.add_child(node)
-    return None
 
 
 # GUI Editor info
+@lru_cache(maxsize=None)
 def get_gui_info():
     """Return GUI editor information - dynamically extracted
     
@@ -495,20 +603,22 @@ def get_gui_info():
     - Native tkinter widgets (Button, Label, Entry, etc.)
     - Canvas-based graphics (turtle, matplotlib plots)
     - Embedded surfaces (pygame via SDL_WINDOWID)
+    
+    The info is static, so it is built once and returned as a read-only mapping.
     """
-    return {
+    return types.MappingProxyType({
         'type': 'container',
         'category': 'window',
         'display_name': 'Window',
         'icon': '🪟',
         'framework': 'tkinter',
         'default_size': (300, 200),
-        'editor_colors': {'bg': '#3c3c3c', 'border': '#569cd6', 'titlebar': '#252526', 'text': '#cccccc'},
-        'properties': _extract_properties(Window),
+        'editor_colors': types.MappingProxyType({'bg': '#3c3c3c', 'border': '#569cd6', 'titlebar': '#252526', 'text': '#cccccc'}),
+        'properties': tuple(_extract_properties(Window)),
         'syntax': '<window title="Window" size="300","200" name="wnd1">',
-        'supports_frameworks': ['tkinter', 'canvas', 'pygame', 'matplotlib', 'turtle'],
+        'supports_frameworks': ('tkinter', 'canvas', 'pygame', 'matplotlib', 'turtle'),
         'description': 'A window container that can host tkinter widgets, canvas graphics, or embedded surfaces'
-    }
+    })
 
 
 def _extract_properties(cls):
@@ -14,8 +14,9 @@ from tkinter import ttk, colorchooser
 import re
 import sys
 import os
-import glob
 import importlib.util
+import weakref
+from functools import partial
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -48,6 +49,24 @@ DEFAULT_EDITOR_COLORS = {
     'surface': {'bg': '#0d0d0d', 'border': '#e94560', 'text': '#e94560'},
 }
 
+# Cache of get_gui_info() results per lib file: filepath -> (mtime, items).
+# Holds plain dicts only (no module references), so unchanged libs are not
+# re-executed every time a registry is loaded. An edited lib replaces its entry.
+_LIB_CACHE = {}
+
+# Add Item menu sections: (category, default icon, default framework, always show framework)
+_MENU_SECTIONS = (
+    ('Containers', '📦', 'tkinter', False),
+    ('Widgets', '📦', 'tkinter', False),
+    ('Graphics', '🎨', 'canvas', True),    # Canvas-based elements like plots, turtle, etc.
+    ('Surfaces', '🎮', 'surface', True),   # Embedded surfaces like pygame
+)
+
+
+def _display_name_key(gui_info):
+    """Sort key for registry items"""
+    return gui_info.get('display_name', '')
+
 
 class GUINodeRegistry:
     """Registry of all GUI node types from libs - dynamically discovers all available elements"""
@@ -69,67 +88,84 @@ class GUINodeRegistry:
         self.graphics = []
         self.surfaces = []
         self.all_items = []
+        # Categories share the typed lists, so each item is only appended once
         self._categories = {
-            'Containers': [],
-            'Widgets': [],
-            'Graphics': [],
-            'Surfaces': []
+            'Containers': self.containers,
+            'Widgets': self.widgets,
+            'Graphics': self.graphics,
+            'Surfaces': self.surfaces
         }
         
         libs_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'libs')
         
-        for lib_file in glob.glob(os.path.join(libs_path, '*.py')):
-            if lib_file.endswith('__init__.py'):
-                continue
-            self._load_from_lib(lib_file)
+        with os.scandir(libs_path) as entries:
+            for entry in entries:
+                if entry.name.endswith('.py') and entry.name != '__init__.py' and entry.is_file():
+                    self._load_from_lib(entry.path)
+        
+        # Sort each category once - menus reuse the sorted lists
+        for items in self._categories.values():
+            items.sort(key=_display_name_key)
         
         # Build flat list for menu
         self._build_menu_items()
+        self._build_menu_labels()
     
     def _load_from_lib(self, filepath):
         """Load GUI info from a lib file"""
         module_name = os.path.basename(filepath)[:-3]
         
         try:
-            spec = importlib.util.spec_from_file_location(module_name, filepath)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            mtime = os.path.getmtime(filepath)
+            cached = _LIB_CACHE.get(filepath)
+            items = cached[1] if cached is not None and cached[0] == mtime else None
             
-            if hasattr(module, 'get_gui_info'):
-                gui_info_result = module.get_gui_info()
-                
-                # get_gui_info() may return a single dict OR a list of dicts
-                if isinstance(gui_info_result, list):
-                    items = gui_info_result
-                else:
-                    items = [gui_info_result]
+            if items is None:
+                spec = importlib.util.spec_from_file_location(module_name, filepath)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
                 
-                for gui_info in items:
-                    category = gui_info.get('category', module_name)
-                    gui_info['_module'] = module_name
-                    gui_info['_source'] = filepath
-                    self.nodes[category] = gui_info
+                items = []
+                if hasattr(module, 'get_gui_info'):
+                    gui_info_result = module.get_gui_info()
                     
-                    element_type = gui_info.get('type', 'widget')
-                    framework = gui_info.get('framework', 'tkinter')
-                    
-                    if element_type == 'container':
-                        self.containers.append(gui_info)
-                        self._categories['Containers'].append(gui_info)
-                    elif element_type == 'widget':
-                        self.widgets.append(gui_info)
-                        self._categories['Widgets'].append(gui_info)
-                    elif element_type == 'graphic' or framework == 'canvas':
-                        self.graphics.append(gui_info)
-                        self._categories['Graphics'].append(gui_info)
-                    elif element_type == 'surface' or framework in ('pygame', 'sdl', 'opengl'):
-                        self.surfaces.append(gui_info)
-                        self._categories['Surfaces'].append(gui_info)
+                    # get_gui_info() may return a single dict OR a list of dicts
+                    if isinstance(gui_info_result, list):
+                        items = gui_info_result
                     else:
-                        # Default to widgets
-                        self.widgets.append(gui_info)
-                        self._categories['Widgets'].append(gui_info)
-                    
+                        items = [gui_info_result]
+                
+                _LIB_CACHE[filepath] = (mtime, items)
+            
+            for gui_info in items:
+                # Copy - libs may return a cached, read-only mapping, and the
+                # shared cache entry must not get this registry's _module/_source
+                gui_info = dict(gui_info)
+                # The same few type/framework names repeat across all items and elements
+                for key in ('category', 'type', 'framework'):
+                    value = gui_info.get(key)
+                    if isinstance(value, str):
+                        gui_info[key] = sys.intern(value)
+                category = gui_info.get('category', module_name)
+                gui_info['_module'] = module_name
+                gui_info['_source'] = filepath
+                self.nodes[category] = gui_info
+                
+                element_type = gui_info.get('type', 'widget')
+                framework = gui_info.get('framework', 'tkinter')
+                
+                if element_type == 'container':
+                    self.containers.append(gui_info)
+                elif element_type == 'widget':
+                    self.widgets.append(gui_info)
+                elif element_type == 'graphic' or framework == 'canvas':
+                    self.graphics.append(gui_info)
+                elif element_type == 'surface' or framework in ('pygame', 'sdl', 'opengl'):
+                    self.surfaces.append(gui_info)
+                else:
+                    # Default to widgets
+                    self.widgets.append(gui_info)
+                
         except Exception as e:
             print(f"GUINodeRegistry: Could not load {filepath}: {e}")
     
@@ -137,29 +173,23 @@ class GUINodeRegistry:
         """Build flat list of all items for dropdown menu"""
         self.all_items = []
         
-        # Add containers first
-        if self.containers:
-            self.all_items.append({'type': 'separator', 'label': '── Containers ──'})
-            for item in sorted(self.containers, key=lambda x: x.get('display_name', '')):
-                self.all_items.append(item)
-        
-        # Add widgets
-        if self.widgets:
-            self.all_items.append({'type': 'separator', 'label': '── Widgets ──'})
-            for item in sorted(self.widgets, key=lambda x: x.get('display_name', '')):
-                self.all_items.append(item)
-        
-        # Add graphics elements
-        if self.graphics:
-            self.all_items.append({'type': 'separator', 'label': '── Graphics ──'})
-            for item in sorted(self.graphics, key=lambda x: x.get('display_name', '')):
-                self.all_items.append(item)
-        
-        # Add surface elements
-        if self.surfaces:
-            self.all_items.append({'type': 'separator', 'label': '── Surfaces ──'})
-            for item in sorted(self.surfaces, key=lambda x: x.get('display_name', '')):
-                self.all_items.append(item)
+        # Containers first, then widgets, graphics and surfaces - already sorted
+        for category, items in self._categories.items():
+            if items:
+                self.all_items.append({'type': 'separator', 'label': f'── {category} ──'})
+                self.all_items.extend(items)
+    
+    def _build_menu_labels(self):
+        """Format each item's Add Item menu label once per load"""
+        for category, default_icon, default_framework, always_show_framework in _MENU_SECTIONS:
+            for gui_info in self._categories[category]:
+                icon = gui_info.get('icon', default_icon)
+                name = gui_info.get('display_name', gui_info.get('category', 'Unknown'))
+                framework = gui_info.get('framework', default_framework)
+                label = f"{icon} {name}"
+                if always_show_framework or framework != 'tkinter':
+                    label += f" ({framework})"
+                gui_info['_menu_label'] = label
     
     def get_containers(self):
         return self.containers
@@ -186,6 +216,29 @@ class GUINodeRegistry:
         return self.nodes.get(category)
 
 
+# Shared registry - GUICanvas and GUIEditPanel use the same instance
+_DEFAULT_REGISTRY = None
+
+
+def get_default_registry():
+    """Get the shared GUINodeRegistry, loading libs on first use"""
+    global _DEFAULT_REGISTRY
+    if _DEFAULT_REGISTRY is None:
+        _DEFAULT_REGISTRY = GUINodeRegistry()
+        _DEFAULT_REGISTRY.load_from_libs()
+    return _DEFAULT_REGISTRY
+
+
+# <gui> / </gui> markers ending a line - blocks are found from the markers in one sweep
+_GUI_MARKER_RE = re.compile(r'<(/?)gui>[ \t]*\r?$', re.MULTILINE)
+
+# Attribute text of a tag - handles > inside quoted values like backgroundcolor="<bc_value>"
+_ATTR_PATTERN = r'(?:[^>"]*|"[^"]*")*'
+_TAG_RE = re.compile(rf'<(\w+)\s+({_ATTR_PATTERN})>')
+_SIZE_RE = re.compile(r'size="(\d+)"(?:,"(\d+)")?')
+_ATTR_RE = re.compile(r'(\w+)="([^"]*)"')
+
+
 class GUIBlock:
     """Represents a <gui>...</gui> block in the code"""
     
@@ -198,24 +251,27 @@ class GUIBlock:
     def find_all_blocks(code):
         """Find all GUI blocks in the code"""
         blocks = []
-        lines = code.split('\n')
         
-        in_block = False
-        block_start = 0
-        block_content = []
+        open_match = None
+        open_line = 0
+        line, pos = 1, 0
         
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
+        for match in _GUI_MARKER_RE.finditer(code):
+            start = match.start()
+            line_start = code.rfind('\n', 0, start) + 1
+            if code[line_start:start].strip(' \t'):
+                continue  # Marker must be alone on its line
             
-            if stripped == '<gui>':
-                in_block = True
-                block_start = i
-                block_content = []
-            elif stripped == '</gui>' and in_block:
-                blocks.append(GUIBlock(block_start, i, '\n'.join(block_content)))
-                in_block = False
-            elif in_block:
-                block_content.append(line)
+            line += code.count('\n', pos, start)
+            pos = start
+            
+            if not match.group(1):
+                open_match, open_line = match, line  # <gui> (re)starts a block
+            elif open_match:
+                # Body runs from the line after <gui> to the line before </gui>
+                body = code[open_match.end() + 1:line_start - 1]
+                blocks.append(GUIBlock(open_line, line, body))
+                open_match = None
         
         return blocks
     
@@ -224,11 +280,15 @@ class GUIBlock:
         return f"GUI Block (line {self.start_line}-{self.end_line})"
 
 
+# Properties written by to_pytml() itself rather than as extra attributes
+_PYTML_SKIP_PROPS = frozenset({'title', 'text', 'parent', 'x', 'y', 'name', 'size', 'width', 'height'})
+
+
 class GUIElement:
     """Represents a GUI element with relative positioning"""
     
     def __init__(self, element_type, name, x=0, y=0, width=100, height=30):
-        self.element_type = element_type
+        self.element_type = sys.intern(element_type)
         self.name = name
         self.x = x
         self.y = y
@@ -236,8 +296,14 @@ class GUIElement:
         self.height = height
         self.properties = {}
         self.children = []
+        self._child_ids = set()  # id() of each child - O(1) membership for add/remove
         self.parent = None
         self.selected = False
+        self._abs_cache = None  # Absolute position - reset by GUICanvas before each redraw
+        self._canvas_items = None  # [item_id, coords, options] per canvas item, kept by GUICanvas
+        self._canvas_tag = None
+        self._canvas_layout = None
+        self._index_name = None  # Key in GUICanvas.all_elements
     
     def set_property(self, name, value):
         self.properties[name] = value
@@ -247,15 +313,34 @@ class GUIElement:
     
     def add_child(self, child):
         child.parent = self
-        if child not in self.children:
+        child._abs_cache = None
+        if id(child) not in self._child_ids:
+            self._child_ids.add(id(child))
             self.children.append(child)
     
+    def add_children(self, children):
+        """add_child for many children - the list and id set grow once"""
+        child_ids = self._child_ids
+        new_children = []
+        for child in children:
+            child.parent = self
+            child._abs_cache = None
+            if id(child) not in child_ids:
+                child_ids.add(id(child))
+                new_children.append(child)
+        self.children.extend(new_children)
+    
     def remove_child(self, child):
-        if child in self.children:
+        if id(child) in self._child_ids:
+            self._child_ids.discard(id(child))
             self.children.remove(child)
             child.parent = None
+            child._abs_cache = None
     
     def get_absolute_position(self):
+        if self._abs_cache is not None:
+            return self._abs_cache
+        
         abs_x = self.x
         abs_y = self.y
         
@@ -266,7 +351,8 @@ class GUIElement:
             if self.parent.element_type == 'window':
                 abs_y += 30
         
-        return abs_x, abs_y
+        self._abs_cache = (abs_x, abs_y)
+        return self._abs_cache
     
     def contains_point(self, canvas_x, canvas_y):
         abs_x, abs_y = self.get_absolute_position()
@@ -275,43 +361,62 @@ class GUIElement:
     
     def to_pytml(self):
         """Generate PyTML code - includes ALL properties"""
-        attrs = [f'name="{self.name}"']
-        
         if self.element_type == 'window':
-            title = self.get_property('title', 'Window')
-            attrs.insert(0, f'title="{title}"')
-            attrs.append(f'size="{self.width}","{self.height}"')
-        else:
-            if 'text' in self.properties:
-                attrs.insert(0, f'text="{self.properties["text"]}"')
-            if self.parent:
-                attrs.append(f'parent="{self.parent.name}"')
-            attrs.append(f'x="{self.x}"')
-            attrs.append(f'y="{self.y}"')
-        
-        # Add ALL other properties (colors, etc.) - preserves user's code
-        skip_props = {'title', 'text', 'parent', 'x', 'y', 'name', 'size', 'width', 'height'}
-        for prop_name, prop_value in self.properties.items():
-            if prop_name not in skip_props and prop_value is not None:
-                attrs.append(f'{prop_name}="{prop_value}"')
-        
-        return f'<{self.element_type} {" ".join(attrs)}>'
+            return self._window_to_pytml()
+        return self._widget_to_pytml()
+    
+    def _window_to_pytml(self):
+        props = self.properties
+        return (f'<window title="{props.get("title", "Window")}" name="{self.name}" '
+                f'size="{self.width}","{self.height}"{self._extra_attrs(props)}>')
+    
+    def _widget_to_pytml(self):
+        props = self.properties
+        text = f'text="{props["text"]}" ' if 'text' in props else ''
+        parent = f' parent="{self.parent.name}"' if self.parent else ''
+        return (f'<{self.element_type} {text}name="{self.name}"{parent} '
+                f'x="{self.x}" y="{self.y}"{self._extra_attrs(props)}>')
+    
+    @staticmethod
+    def _extra_attrs(props):
+        """ALL other properties (colors, etc.) - preserves user's code"""
+        return ''.join(f' {prop_name}="{prop_value}"' for prop_name, prop_value in props.items()
+                       if prop_value is not None and prop_name not in _PYTML_SKIP_PROPS)
 
 
 class GUICanvas(tk.Canvas):
     """Canvas for visual GUI editing"""
     
-    def __init__(self, parent, on_change=None, **kwargs):
+    # Shared drawing constants
+    _FONT_BODY = ('Segoe UI', 9)
+    _FONT_BOLD = ('Segoe UI', 9, 'bold')
+    _FONT_SMALL = ('Consolas', 8)
+    _FONT_TINY = ('Consolas', 7)
+    _FONT_CANVAS_LABEL = ('Consolas', 10, 'bold')
+    _DASH = (2, 2)
+    _SELECTED_BORDER = '#ff6b6b'
+    
+    def __init__(self, parent, on_change=None, registry=None, **kwargs):
         super().__init__(parent, bg='#2d2d2d', highlightthickness=0, **kwargs)
         
         self.windows = []
-        self.all_elements = {}
+        # Weak - windows/children own the elements, so a missed delete can't keep one alive
+        self.all_elements = weakref.WeakValueDictionary()
         self.selected_element = None
         self.drag_data = {"x": 0, "y": 0, "element": None}
+        self._hit_list = None  # Cached hit-test boxes, rebuilt lazily after changes
+        self._redraw_pending = False  # Drag redraws are coalesced on the idle queue
+        self._redraw_target = None  # Only element the pending redraw has to draw
+        self._item_owners = {}  # id(element) -> element for every element with canvas items
+        self._draw_order = []  # Elements in stacking order as of the last full redraw
+        self._restack = False  # Set when items were recreated on top of the stack
+        self._grid_items = None
+        self._grid_extent = None
+        self._version = 0  # Bumped whenever elements may have changed
+        self._code_cache = None  # (version, lines, code) from the last generate_lines/generate_code
         self.on_select = None
         self.on_change = on_change  # Callback for realtime updates
-        self.registry = GUINodeRegistry()
-        self.registry.load_from_libs()
+        self.registry = registry if registry is not None else get_default_registry()
         
         self.grid_size = 10
         
@@ -327,16 +432,31 @@ class GUICanvas(tk.Canvas):
         self._draw_grid()
     
     def _draw_grid(self):
-        self.delete('grid')
         width = self.winfo_width() or 800
         height = self.winfo_height() or 600
-        
-        for x in range(0, width, self.grid_size * 2):
-            self.create_line(x, 0, x, height, fill='#383838', tags='grid')
-        for y in range(0, height, self.grid_size * 2):
-            self.create_line(0, y, width, y, fill='#383838', tags='grid')
-        
-        self.tag_lower('grid')
+        if self._grid_items and self._grid_extent == (width, height):
+            return
+        self._grid_extent = (width, height)
+        
+        # One serpentine polyline per direction instead of one item per line.
+        # The turns run just outside the canvas, so only the grid lines are visible.
+        step = self.grid_size * 2
+        vertical = []
+        for n, x in enumerate(range(0, width, step)):
+            vertical += (x, -step, x, height + step) if n % 2 == 0 else (x, height + step, x, -step)
+        horizontal = []
+        for n, y in enumerate(range(0, height, step)):
+            horizontal += (-step, y, width + step, y) if n % 2 == 0 else (width + step, y, -step, y)
+        
+        if self._grid_items:
+            self.coords(self._grid_items[0], *vertical)
+            self.coords(self._grid_items[1], *horizontal)
+        else:
+            self._grid_items = (
+                self.create_line(*vertical, fill='#383838', tags='grid'),
+                self.create_line(*horizontal, fill='#383838', tags='grid'),
+            )
+            self.tag_lower('grid')
     
     def _load_colors_from_registry(self):
         """Load editor colors from libs - allows libs to define their own colors"""
@@ -371,71 +491,88 @@ class GUICanvas(tk.Canvas):
             self.on_change()
     
     def add_window(self, element):
+        self._version += 1
+        self._hit_list = None
         self.windows.append(element)
         self.all_elements[element.name] = element
+        element._index_name = element.name
         self._draw_window(element)
         return element
     
     def add_widget(self, element, parent_window):
+        self._version += 1
+        self._hit_list = None
         if parent_window:
             parent_window.add_child(element)
         self.all_elements[element.name] = element
+        element._index_name = element.name
         self._draw_widget(element)
         return element
     
-    def _draw_window(self, window):
+    def add_widgets(self, elements, parent_window):
+        """add_widget for many widgets of one window"""
+        self._version += 1
+        self._hit_list = None
+        parent_window.add_children(elements)
+        self.all_elements.update((element.name, element) for element in elements)
+        for element in elements:
+            element._index_name = element.name
+            self._draw_widget(element)
+    
+    def reindex_element(self, element):
+        """Move a renamed element to its new all_elements key - a taken name is reverted (False)"""
+        old_name = element._index_name
+        new_name = element.name
+        if new_name == old_name:
+            return True
+        if new_name in self.all_elements:
+            element.name = old_name
+            return False
+        self._version += 1
+        self.all_elements.pop(old_name, None)
+        self.all_elements[new_name] = element
+        element._index_name = new_name
+        return True
+    
+    def _draw_window(self, window, with_children=True):
         tag = f"window_{window.name}"
-        self.delete(tag)
         
         abs_x, abs_y = window.get_absolute_position()
+        width, height = window.width, window.height
+        right, bottom = abs_x + width, abs_y + height
         colors = self.colors['window']
         
-        border_color = '#ff6b6b' if window.selected else colors['border']
+        border_color = self._SELECTED_BORDER if window.selected else colors['border']
         border_width = 3 if window.selected else 2
-        
-        self.create_rectangle(
-            abs_x, abs_y, abs_x + window.width, abs_y + window.height,
-            fill=colors['bg'], outline=border_color, width=border_width,
-            tags=(tag, 'window', 'element')
-        )
-        
-        self.create_rectangle(
-            abs_x, abs_y, abs_x + window.width, abs_y + 30,
-            fill=colors['titlebar'], outline='',
-            tags=(tag, 'window', 'element')
-        )
-        
-        title = window.get_property('title', window.name)
-        self.create_text(
-            abs_x + 10, abs_y + 15,
-            text=f"🪟 {title}", fill='#cccccc', font=('Segoe UI', 9, 'bold'),
-            anchor='w', tags=(tag, 'window', 'element')
-        )
-        
-        self.create_text(
-            abs_x + window.width - 10, abs_y + 15,
-            text=f"{window.width}x{window.height}", fill='#808080', font=('Consolas', 8),
-            anchor='e', tags=(tag, 'window', 'element')
-        )
-        
-        self.create_rectangle(
-            abs_x + 2, abs_y + 32,
-            abs_x + window.width - 2, abs_y + window.height - 2,
-            fill='', outline='#4a4a4a', dash=(2, 2),
-            tags=(tag, 'window', 'element')
-        )
-        
-        for child in window.children:
-            self._draw_widget(child)
-        
-        self._raise_window_children(window)
+        title = window.properties.get('title', window.name)
+        
+        self._sync_items(window, tag, 'window', [
+            ('rectangle', (abs_x, abs_y, right, bottom),
+             {'fill': colors['bg'], 'outline': border_color, 'width': border_width}),
+            ('rectangle', (abs_x, abs_y, right, abs_y + 30),
+             {'fill': colors['titlebar'], 'outline': ''}),
+            ('text', (abs_x + 10, abs_y + 15),
+             {'text': f"🪟 {title}", 'fill': '#cccccc', 'font': self._FONT_BOLD, 'anchor': 'w'}),
+            ('text', (right - 10, abs_y + 15),
+             {'text': f"{width}x{height}", 'fill': '#808080', 'font': self._FONT_SMALL,
+              'anchor': 'e'}),
+            ('rectangle', (abs_x + 2, abs_y + 32, right - 2, bottom - 2),
+             {'fill': '', 'outline': '#4a4a4a', 'dash': self._DASH}),
+        ])
+        
+        if with_children:
+            for child in window.children:
+                self._draw_widget(child)
     
     def _draw_widget(self, widget):
         """Draw any widget type - fully dynamic based on registry"""
         tag = f"widget_{widget.name}"
-        self.delete(tag)
         
         abs_x, abs_y = widget.get_absolute_position()
+        width, height = widget.width, widget.height
+        right, bottom = abs_x + width, abs_y + height
+        center_x, center_y = abs_x + width // 2, abs_y + height // 2
+        props = widget.properties
         
         # Get gui_info from registry if available
         gui_info = self.get_element_info(widget.element_type) or {}
@@ -444,132 +581,252 @@ class GUICanvas(tk.Canvas):
         icon = gui_info.get('icon', '📦')
         
         # Get colors - check registry, then widget type, then fallback
-        colors = self.colors.get(widget.element_type, 
-                                 self.colors.get(element_type, 
-                                                 DEFAULT_EDITOR_COLORS['widget']))
+        colors_map = self.colors
+        colors = colors_map.get(widget.element_type)
+        if colors is None:
+            colors = colors_map.get(element_type, DEFAULT_EDITOR_COLORS['widget'])
         
-        border_color = '#ff6b6b' if widget.selected else colors.get('border', '#a29bfe')
+        border_color = self._SELECTED_BORDER if widget.selected else colors.get('border', '#a29bfe')
         border_width = 2 if widget.selected else 1
         bg_color = colors.get('bg', '#2d3436')
         text_color = colors.get('text', '#dfe6e9')
         
+        items = []
+        add = items.append
+        
         # Draw based on category type
         if element_type == 'graphic' or framework == 'canvas':
             # Canvas/graphic elements - grid pattern
-            self.create_rectangle(
-                abs_x, abs_y, abs_x + widget.width, abs_y + widget.height,
-                fill=bg_color, outline=border_color, width=border_width,
-                tags=(tag, 'widget', 'element')
-            )
+            add(('rectangle', (abs_x, abs_y, right, bottom),
+                {'fill': bg_color, 'outline': border_color, 'width': border_width}))
             # Grid pattern
-            for i in range(0, widget.width, 20):
-                self.create_line(abs_x + i, abs_y, abs_x + i, abs_y + widget.height,
-                               fill='#2a2a4e', tags=(tag, 'widget', 'element'))
-            for i in range(0, widget.height, 20):
-                self.create_line(abs_x, abs_y + i, abs_x + widget.width, abs_y + i,
-                               fill='#2a2a4e', tags=(tag, 'widget', 'element'))
-            text = widget.get_property('text', f'{icon} {widget.element_type}')
-            self.create_text(
-                abs_x + widget.width // 2, abs_y + widget.height // 2,
-                text=text, fill=text_color, font=('Consolas', 10, 'bold'),
-                tags=(tag, 'widget', 'element')
-            )
-            self.create_text(
-                abs_x + widget.width - 5, abs_y + 12,
-                text=f"🎨 {framework}", fill='#808080', font=('Consolas', 8),
-                anchor='e', tags=(tag, 'widget', 'element')
-            )
+            for i in range(0, width, 20):
+                add(('line', (abs_x + i, abs_y, abs_x + i, bottom),
+                    {'fill': '#2a2a4e'}))
+            for i in range(0, height, 20):
+                add(('line', (abs_x, abs_y + i, right, abs_y + i),
+                    {'fill': '#2a2a4e'}))
+            text = props.get('text', f'{icon} {widget.element_type}')
+            add(('text', (center_x, center_y),
+                {'text': text, 'fill': text_color, 'font': self._FONT_CANVAS_LABEL}))
+            add(('text', (right - 5, abs_y + 12),
+                {'text': f"🎨 {framework}", 'fill': '#808080', 'font': self._FONT_SMALL,
+                 'anchor': 'e'}))
             
         elif element_type == 'surface' or framework in ('pygame', 'sdl', 'opengl'):
             # Embedded surface - X pattern
-            self.create_rectangle(
-                abs_x, abs_y, abs_x + widget.width, abs_y + widget.height,
-                fill=bg_color, outline=border_color, width=border_width,
-                tags=(tag, 'widget', 'element')
-            )
-            self.create_line(abs_x, abs_y, abs_x + widget.width, abs_y + widget.height,
-                           fill='#2a2a2a', tags=(tag, 'widget', 'element'))
-            self.create_line(abs_x + widget.width, abs_y, abs_x, abs_y + widget.height,
-                           fill='#2a2a2a', tags=(tag, 'widget', 'element'))
-            text = widget.get_property('text', f'{icon} {widget.element_type}')
-            self.create_text(
-                abs_x + widget.width // 2, abs_y + widget.height // 2,
-                text=text, fill=text_color, font=('Consolas', 10, 'bold'),
-                tags=(tag, 'widget', 'element')
-            )
-            self.create_text(
-                abs_x + widget.width - 5, abs_y + 12,
-                text=f"🎮 {framework}", fill='#808080', font=('Consolas', 8),
-                anchor='e', tags=(tag, 'widget', 'element')
-            )
+            add(('rectangle', (abs_x, abs_y, right, bottom),
+                {'fill': bg_color, 'outline': border_color, 'width': border_width}))
+            add(('line', (abs_x, abs_y, right, bottom),
+                {'fill': '#2a2a2a'}))
+            add(('line', (right, abs_y, abs_x, bottom),
+                {'fill': '#2a2a2a'}))
+            text = props.get('text', f'{icon} {widget.element_type}')
+            add(('text', (center_x, center_y),
+                {'text': text, 'fill': text_color, 'font': self._FONT_CANVAS_LABEL}))
+            add(('text', (right - 5, abs_y + 12),
+                {'text': f"🎮 {framework}", 'fill': '#808080', 'font': self._FONT_SMALL,
+                 'anchor': 'e'}))
         
         else:
             # Standard widget - rectangle with text
             # Use transparent bg for label-like widgets (no fill)
             if bg_color == 'transparent':
                 # Draw text only with optional selection border
-                text = widget.get_property('text', widget.name)
-                self.create_text(
-                    abs_x, abs_y + widget.height // 2,
-                    text=f"{icon} {text}", fill=text_color, font=('Segoe UI', 9),
-                    anchor='w', tags=(tag, 'widget', 'element')
-                )
+                text = props.get('text', widget.name)
+                add(('text', (abs_x, center_y),
+                    {'text': f"{icon} {text}", 'fill': text_color, 'font': self._FONT_BODY,
+                     'anchor': 'w'}))
                 if widget.selected:
-                    self.create_rectangle(
-                        abs_x - 2, abs_y, abs_x + widget.width + 2, abs_y + widget.height,
-                        fill='', outline=border_color, width=border_width, dash=(2, 2),
-                        tags=(tag, 'widget', 'element')
-                    )
+                    add(('rectangle',
+                        (abs_x - 2, abs_y, right + 2, bottom),
+                        {'fill': '', 'outline': border_color, 'width': border_width,
+                         'dash': self._DASH}))
             else:
                 # Normal widget with background
-                self.create_rectangle(
-                    abs_x, abs_y, abs_x + widget.width, abs_y + widget.height,
-                    fill=bg_color, outline=border_color, width=border_width,
-                    tags=(tag, 'widget', 'element')
-                )
-                text = widget.get_property('text', widget.get_property('placeholder', widget.name))
-                self.create_text(
-                    abs_x + widget.width // 2, abs_y + widget.height // 2,
-                    text=f"{icon} {text}", fill=text_color, font=('Segoe UI', 9),
-                    tags=(tag, 'widget', 'element')
-                )
+                add(('rectangle', (abs_x, abs_y, right, bottom),
+                    {'fill': bg_color, 'outline': border_color, 'width': border_width}))
+                text = props.get('text', props.get('placeholder', widget.name))
+                add(('text', (center_x, center_y),
+                    {'text': f"{icon} {text}", 'fill': text_color, 'font': self._FONT_BODY}))
         
         # Position indicator
-        self.create_text(
-            abs_x + widget.width // 2, abs_y + widget.height + 8,
-            text=f"({widget.x}, {widget.y})", fill='#606060', font=('Consolas', 7),
-            tags=(tag, 'widget', 'element')
-        )
+        add(('text', (center_x, bottom + 8),
+            {'text': f"({widget.x}, {widget.y})", 'fill': '#606060', 'font': self._FONT_TINY}))
+        
+        self._sync_items(widget, tag, 'widget', items)
+    
+    def _sync_items(self, element, tag, group, items):
+        """Create or update the canvas items of an element.
+        
+        items is a list of (kind, coords, options). When the element already has
+        items of the same kinds, they are kept and only changed coords/options
+        are sent to Tk - otherwise the items are recreated.
+        """
+        layout = [(kind, tuple(options)) for kind, coords, options in items]
+        current = element._canvas_items
+        
+        if current is not None and element._canvas_tag == tag and element._canvas_layout == layout:
+            for item, (kind, coords, options) in zip(current, items):
+                if item[1] != coords:
+                    self.coords(item[0], *coords)
+                    item[1] = coords
+                if item[2] != options:
+                    self.itemconfigure(item[0], **options)
+                    item[2] = options
+        else:
+            if current is not None:
+                self.delete(*[item[0] for item in current])
+                self._restack = True
+            tags = (tag, group, 'element')
+            element._canvas_items = [
+                [getattr(self, 'create_' + kind)(*coords, tags=tags, **options), coords, options]
+                for kind, coords, options in items
+            ]
+            element._canvas_tag = tag
+            element._canvas_layout = layout
+            self._item_owners[id(element)] = element
+    
+    def _delete_items(self, element):
+        """Remove an element's canvas items"""
+        if element._canvas_items is not None:
+            self.delete(*[item[0] for item in element._canvas_items])
+            element._canvas_items = None
+        self._item_owners.pop(id(element), None)
     
     def _raise_window_children(self, window):
         for child in window.children:
             tag = f"widget_{child.name}"
             self.tag_raise(tag)
     
+    def _invalidate_positions(self):
+        """Forget cached absolute positions after elements have moved"""
+        for window in self.windows:
+            window._abs_cache = None
+            for child in window.children:
+                child._abs_cache = None
+    
+    def _schedule_redraw(self, element=None):
+        """Redraw once when Tk is idle - many motion events share one redraw.
+        
+        With element only that element is redrawn, unless other redraws were
+        requested before Tk got idle.
+        """
+        self._version += 1
+        self._invalidate_positions()
+        self._hit_list = None
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self._redraw_target = element
+            self.after_idle(self._flush_redraw)
+        elif self._redraw_target is not element:
+            self._redraw_target = None
+    
+    def _flush_redraw(self):
+        if self._redraw_pending:
+            if self._redraw_target is not None:
+                self._redraw_pending = False
+                self.redraw_element(self._redraw_target)
+            else:
+                self.redraw_all()
+    
+    def redraw_element(self, element):
+        """Redraw one changed element - a window brings its children along"""
+        if element._canvas_items is None:
+            self.redraw_all()  # Not drawn yet
+            return
+        
+        self._version += 1
+        self._hit_list = None
+        element._abs_cache = None
+        if element.parent is None:
+            for child in element.children:
+                child._abs_cache = None
+            self._draw_window(element)
+        else:
+            self._draw_widget(element)
+        
+        if self._restack:
+            self.redraw_all()  # Recreated items landed on top - restore stacking
+    
     def redraw_all(self):
-        self.delete('element')
+        self._version += 1
+        self._redraw_pending = False
+        self._invalidate_positions()
+        self._hit_list = None
+        
+        # Update items in place; elements that are gone lose their items
+        drawn = []
         for window in self.windows:
             self._draw_window(window)
+            drawn.append(window)
+            drawn.extend(window.children)
+        
+        if len(self._item_owners) != len(drawn):
+            drawn_ids = set(map(id, drawn))
+            for key, element in list(self._item_owners.items()):
+                if key not in drawn_ids:
+                    self._delete_items(element)
+        
+        # Kept items keep their stacking - raise in draw order if it changed
+        if self._restack or drawn != self._draw_order:
+            for element in drawn:
+                self.tag_raise(element._canvas_tag)
+        self._draw_order = drawn
+        self._restack = False
     
-    def _find_element_at(self, x, y):
+    def _restyle(self, *elements):
+        """Redraw only the given elements (e.g. selection change) without a full redraw"""
+        for element in elements:
+            if element is None or element._canvas_items is None:
+                continue
+            if element.parent is None:
+                self._draw_window(element, with_children=False)
+            else:
+                self._draw_widget(element)
+        
+        if self._restack:
+            self.redraw_all()  # Recreated items landed on top - restore stacking
+    
+    def _build_hit_list(self):
+        """Build (x1, y1, x2, y2, element) boxes in hit-test order"""
+        hit_list = []
+        
+        # Children of all windows before the windows themselves, topmost first.
+        # The topmost window's children lead the list, so the common click on
+        # the front window only tests that window's children.
         for window in reversed(self.windows):
             for child in reversed(window.children):
-                if child.contains_point(x, y):
-                    return child
+                abs_x, abs_y = child.get_absolute_position()
+                hit_list.append((abs_x, abs_y, abs_x + child.width, abs_y + child.height, child))
         
         for window in reversed(self.windows):
-            if window.contains_point(x, y):
-                return window
+            abs_x, abs_y = window.get_absolute_position()
+            hit_list.append((abs_x, abs_y, abs_x + window.width, abs_y + window.height, window))
+        
+        self._hit_list = hit_list
+        return hit_list
+    
+    def _find_element_at(self, x, y):
+        hit_list = self._hit_list
+        if hit_list is None:
+            hit_list = self._build_hit_list()
+        
+        for x1, y1, x2, y2, element in hit_list:
+            if x1 <= x <= x2 and y1 <= y <= y2:
+                return element
         
         return None
     
     def _on_click(self, event):
         clicked = self._find_element_at(event.x, event.y)
         
-        if self.selected_element:
-            self.selected_element.selected = False
+        previous = self.selected_element
+        if previous:
+            previous.selected = False
         
         self.selected_element = clicked
+        reordered = False
         
         if clicked:
             clicked.selected = True
@@ -578,25 +835,35 @@ class GUICanvas(tk.Canvas):
             self.drag_data = {
                 "x": event.x - abs_x,
                 "y": event.y - abs_y,
-                "element": clicked
+                "element": clicked,
+                "orig_x": clicked.x,
+                "orig_y": clicked.y
             }
             
             if clicked.parent:
-                self._bring_window_to_front(clicked.parent)
+                reordered = self._bring_window_to_front(clicked.parent)
             elif clicked.element_type == 'window':
-                self._bring_window_to_front(clicked)
+                reordered = self._bring_window_to_front(clicked)
         else:
             self.drag_data = {"x": 0, "y": 0, "element": None}
         
-        self.redraw_all()
+        if reordered:
+            self.redraw_all()
+        elif previous is not clicked:
+            # Selection is a pure style change - only update the two elements
+            self._restyle(previous, clicked)
         
         if self.on_select:
             self.on_select(clicked)
     
     def _bring_window_to_front(self, window):
-        if window in self.windows:
+        """Move window to the top - returns True if the stacking changed"""
+        if window in self.windows and self.windows[-1] is not window:
+            self._hit_list = None
             self.windows.remove(window)
             self.windows.append(window)
+            return True
+        return False
     
     def _on_drag(self, event):
         element = self.drag_data.get("element")
@@ -609,9 +876,10 @@ class GUICanvas(tk.Canvas):
             element.x = max(0, new_x)
             element.y = max(0, new_y)
         else:
-            if element.parent:
-                parent_x, parent_y = element.parent.get_absolute_position()
-                titlebar_offset = 30 if element.parent.element_type == 'window' else 0
+            parent = element.parent
+            if parent:
+                parent_x, parent_y = parent.get_absolute_position()
+                titlebar_offset = 30 if parent.element_type == 'window' else 0
                 
                 new_abs_x = event.x - self.drag_data["x"]
                 new_abs_y = event.y - self.drag_data["y"]
@@ -622,27 +890,47 @@ class GUICanvas(tk.Canvas):
                 new_rel_x = round(new_rel_x / self.grid_size) * self.grid_size
                 new_rel_y = round(new_rel_y / self.grid_size) * self.grid_size
                 
-                new_rel_x = max(0, min(new_rel_x, element.parent.width - element.width))
-                new_rel_y = max(0, min(new_rel_y, element.parent.height - titlebar_offset - element.height))
+                new_rel_x = max(0, min(new_rel_x, parent.width - element.width))
+                new_rel_y = max(0, min(new_rel_y, parent.height - titlebar_offset - element.height))
                 
                 element.x = new_rel_x
                 element.y = new_rel_y
         
-        self.redraw_all()
+        self._schedule_redraw(element)
     
     def _on_release(self, event):
-        if self.drag_data.get("element"):
-            self._notify_change()  # Realtime sync after drag
+        element = self.drag_data.get("element")
+        # Realtime sync after drag - a click without movement changes nothing
+        if element and (element.x != self.drag_data.get("orig_x") or
+                        element.y != self.drag_data.get("orig_y")):
+            self._notify_change()
         self.drag_data = {"x": 0, "y": 0, "element": None}
     
     def clear(self):
         self.delete('element')
+        for element in self._item_owners.values():
+            element._canvas_items = None
+        self._item_owners = {}
+        self._draw_order = []
+        self._version += 1
         self.windows = []
-        self.all_elements = {}
+        self._hit_list = None
+        self.all_elements = weakref.WeakValueDictionary()
         self.selected_element = None
     
     def generate_code(self):
         """Generate PyTML code for all elements"""
+        return self._generate()[2]
+    
+    def generate_lines(self):
+        """Generate PyTML code for all elements as a list of lines (shared - don't modify)"""
+        return self._generate()[1]
+    
+    def _generate(self):
+        """(version, lines, code) - only regenerated after the elements may have changed"""
+        if self._code_cache is not None and self._code_cache[0] == self._version:
+            return self._code_cache
+        
         lines = []
         
         for window in self.windows:
@@ -652,7 +940,8 @@ class GUICanvas(tk.Canvas):
             for child in window.children:
                 lines.append(child.to_pytml())
         
-        return '\n'.join(lines)
+        self._code_cache = (self._version, lines, '\n'.join(lines))
+        return self._code_cache
 
 
 class GUIEditPanel(ttk.Frame):
@@ -662,15 +951,19 @@ class GUIEditPanel(ttk.Frame):
         super().__init__(parent)
         self.on_code_change = on_code_change
         self.on_element_select = on_element_select  # External callback for element selection
-        self.registry = GUINodeRegistry()
-        self.registry.load_from_libs()
+        self.registry = get_default_registry()
         self._element_counter = 0
         
         # GUI block tracking
         self.gui_blocks = []
         self.active_block_index = 0
         self.full_code = ""
+        self._code_lines = []  # full_code split into lines
+        self._last_gui_content = None  # Block content of the last sync - None after a (re)load
+        self._block_combo_values = None  # Labels last set on block_combo
         self._updating_code = False  # Prevent recursion
+        self._add_menu_fingerprint = None  # Registry content the Add Item menu was built from
+        self._sync_after_id = None  # Pending debounced _sync_to_code
         
         self._setup_ui()
     
@@ -709,7 +1002,8 @@ class GUIEditPanel(ttk.Frame):
         canvas_frame = ttk.Frame(self)
         canvas_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        self.canvas = GUICanvas(canvas_frame, on_change=self._on_canvas_change)
+        self.canvas = GUICanvas(canvas_frame, on_change=self._on_canvas_change,
+                                registry=self.registry)
         self.canvas.pack(fill=tk.BOTH, expand=True)
         self.canvas.on_select = self._on_element_select_internal
         
@@ -725,67 +1019,30 @@ class GUIEditPanel(ttk.Frame):
     
     def _populate_add_menu(self):
         """Populate the Add Item dropdown menu with all available elements from libs"""
-        self.add_menu.delete(0, tk.END)
-        
         categories = self.registry.get_categories()
         
-        # Add Containers section
-        if categories.get('Containers'):
-            self.add_menu.add_command(label="── Containers ──", state='disabled')
-            for gui_info in categories['Containers']:
-                icon = gui_info.get('icon', '📦')
-                name = gui_info.get('display_name', gui_info.get('category', 'Unknown'))
-                framework = gui_info.get('framework', 'tkinter')
-                label = f"{icon} {name}"
-                if framework != 'tkinter':
-                    label += f" ({framework})"
-                self.add_menu.add_command(
-                    label=label,
-                    command=lambda g=gui_info: self._add_item(g)
-                )
-            self.add_menu.add_separator()
-        
-        # Add Widgets section
-        if categories.get('Widgets'):
-            self.add_menu.add_command(label="── Widgets ──", state='disabled')
-            for gui_info in categories['Widgets']:
-                icon = gui_info.get('icon', '📦')
-                name = gui_info.get('display_name', gui_info.get('category', 'Unknown'))
-                framework = gui_info.get('framework', 'tkinter')
-                label = f"{icon} {name}"
-                if framework != 'tkinter':
-                    label += f" ({framework})"
-                self.add_menu.add_command(
-                    label=label,
-                    command=lambda g=gui_info: self._add_item(g)
-                )
-            self.add_menu.add_separator()
+        # Skip the Tk rebuild when a refresh found the same items (compared by value)
+        fingerprint = tuple(tuple(items) for items in categories.values())
+        if fingerprint == self._add_menu_fingerprint:
+            return
+        self._add_menu_fingerprint = fingerprint
         
-        # Add Graphics section (for canvas-based elements like plots, turtle, etc.)
-        if categories.get('Graphics'):
-            self.add_menu.add_command(label="── Graphics ──", state='disabled')
-            for gui_info in categories['Graphics']:
-                icon = gui_info.get('icon', '🎨')
-                name = gui_info.get('display_name', gui_info.get('category', 'Unknown'))
-                framework = gui_info.get('framework', 'canvas')
-                label = f"{icon} {name} ({framework})"
-                self.add_menu.add_command(
-                    label=label,
-                    command=lambda g=gui_info: self._add_item(g)
-                )
-            self.add_menu.add_separator()
+        self.add_menu.delete(0, tk.END)
         
-        # Add Surfaces section (for embedded surfaces like pygame)
-        if categories.get('Surfaces'):
-            self.add_menu.add_command(label="── Surfaces ──", state='disabled')
-            for gui_info in categories['Surfaces']:
-                icon = gui_info.get('icon', '🎮')
-                name = gui_info.get('display_name', gui_info.get('category', 'Unknown'))
-                framework = gui_info.get('framework', 'surface')
-                label = f"{icon} {name} ({framework})"
+        first_section = True
+        for category, items in categories.items():
+            if not items:
+                continue
+            if not first_section:
+                self.add_menu.add_separator()
+            first_section = False
+            
+            # Labels are formatted by the registry when it loads
+            self.add_menu.add_command(label=f"── {category} ──", state='disabled')
+            for gui_info in items:
                 self.add_menu.add_command(
-                    label=label,
-                    command=lambda g=gui_info: self._add_item(g)
+                    label=gui_info['_menu_label'],
+                    command=partial(self._add_item, gui_info)
                 )
         
         # If no items found, show info
@@ -818,11 +1075,32 @@ class GUIEditPanel(ttk.Frame):
 
     def _on_canvas_change(self):
         """Callback when canvas changes (drag etc)"""
-        self._sync_to_code()
+        self.schedule_sync()
         # Notify external callback that element may have changed
         if self.on_element_select and self.canvas.selected_element:
             self.on_element_select(self.canvas.selected_element, self.registry)
     
+    def schedule_sync(self):
+        """Sync canvas to code shortly - a burst of changes becomes one sync"""
+        if self._sync_after_id is not None:
+            self.after_cancel(self._sync_after_id)
+        self._sync_after_id = self.after(30, self._do_sync)
+    
+    def _cancel_sync(self):
+        if self._sync_after_id is not None:
+            self.after_cancel(self._sync_after_id)
+            self._sync_after_id = None
+    
+    def _do_sync(self):
+        self._sync_after_id = None
+        self._sync_to_code()
+    
+    def flush_sync(self):
+        """Run a pending sync now (before saving/running the code)"""
+        if self._sync_after_id is not None:
+            self._cancel_sync()
+            self._sync_to_code()
+    
     def _sync_to_code(self):
         """Synchronize canvas to code in realtime"""
         if self._updating_code:
@@ -832,23 +1110,33 @@ class GUIEditPanel(ttk.Frame):
         
         try:
             # Generate new code for GUI block
+            gui_lines = self.canvas.generate_lines()
             new_gui_content = self.canvas.generate_code()
+            if new_gui_content == self._last_gui_content:
+                return  # Code already matches the canvas
+            if gui_lines and len(gui_lines) != new_gui_content.count('\n') + 1:
+                gui_lines = new_gui_content.split('\n')  # An attribute value spans lines
             
             if self.gui_blocks and self.active_block_index < len(self.gui_blocks):
-                # Replace existing block
+                # Replace existing block in the cached line list
                 block = self.gui_blocks[self.active_block_index]
-                lines = self.full_code.split('\n')
+                if not gui_lines and block.end_line - block.start_line == 1:
+                    self._last_gui_content = new_gui_content
+                    return  # Empty canvas and the block is already an empty <gui>/</gui> pair
+                self._code_lines[block.start_line - 1:block.end_line] = ['<gui>', *gui_lines, '</gui>']
                 
-                # Build new code
-                new_lines = []
-                new_lines.extend(lines[:block.start_line - 1])  # Before block
-                new_lines.append('<gui>')
-                if new_gui_content:
-                    new_lines.extend(new_gui_content.split('\n'))
-                new_lines.append('</gui>')
-                new_lines.extend(lines[block.end_line:])  # After block
+                # Blocks after this one move by the change in line count
+                new_end_line = block.start_line + len(gui_lines) + 1
+                delta = new_end_line - block.end_line
+                block.end_line = new_end_line
+                block.content = new_gui_content
+                if delta:
+                    for later in self.gui_blocks[self.active_block_index + 1:]:
+                        later.start_line += delta
+                        later.end_line += delta
                 
-                new_code = '\n'.join(new_lines)
+                new_code = '\n'.join(self._code_lines)
+                self.full_code = new_code
             else:
                 # No existing block - don't add anything
                 # (only via "New Block" button)
@@ -856,6 +1144,7 @@ class GUIEditPanel(ttk.Frame):
             
             if self.on_code_change:
                 self.on_code_change(new_code, realtime=True)
+            self._last_gui_content = new_gui_content
             
         finally:
             self._updating_code = False
@@ -888,16 +1177,23 @@ class GUIEditPanel(ttk.Frame):
     def _update_block_combo(self):
         """Update block combobox"""
         if not self.gui_blocks:
-            self.block_combo['values'] = ['(No GUI blocks)']
-            self.block_combo.current(0)
+            values = ('(No GUI blocks)',)
         else:
-            values = [block.get_label() for block in self.gui_blocks]
+            values = tuple(block.get_label() for block in self.gui_blocks)
+        
+        # Only hand Tk a new list when a label actually changed
+        if values != self._block_combo_values:
             self.block_combo['values'] = values
-            if self.active_block_index < len(values):
-                self.block_combo.current(self.active_block_index)
+            self._block_combo_values = values
+        
+        if not self.gui_blocks:
+            self.block_combo.current(0)
+        elif self.active_block_index < len(values):
+            self.block_combo.current(self.active_block_index)
     
     def _load_block(self, block):
         """Load a specific GUI block"""
+        self._last_gui_content = None
         self.canvas.clear()
         self._element_counter = 0
         self._parse_gui_content(block.content)
@@ -910,20 +1206,24 @@ class GUIEditPanel(ttk.Frame):
         
         if element.element_type == 'window':
             self.canvas.windows.remove(element)
-            for child in element.children:
-                del self.canvas.all_elements[child.name]
-            del self.canvas.all_elements[element.name]
+            removed = [element, *element.children]
         else:
-            if element.parent:
-                element.parent.remove_child(element)
-            del self.canvas.all_elements[element.name]
+            parent = element.parent
+            if parent:
+                parent.remove_child(element)
+            removed = [element]
+        
+        # Drop the names of the element and its subtree in one pass
+        all_elements = self.canvas.all_elements
+        for gone in removed:
+            all_elements.pop(gone.name, None)
         
         self.canvas.selected_element = None
         self.canvas.redraw_all()
         # Notify external callback that selection cleared
         if self.on_element_select:
             self.on_element_select(None, self.registry)
-        self._sync_to_code()
+        self.schedule_sync()
         self.info_var.set("Element deleted")
     
     def _get_next_name(self, prefix):
@@ -941,7 +1241,7 @@ class GUIEditPanel(ttk.Frame):
         element.set_property('framework', framework)
         
         self.canvas.add_window(element)
-        self._sync_to_code()
+        self.schedule_sync()
         self.info_var.set(f"Added {category}: {name}")
     
     def _add_widget(self, gui_info):
@@ -950,11 +1250,12 @@ class GUIEditPanel(ttk.Frame):
             return
         
         parent = self.canvas.windows[-1]
-        if self.canvas.selected_element:
-            if self.canvas.selected_element.element_type == 'window':
-                parent = self.canvas.selected_element
-            elif self.canvas.selected_element.parent:
-                parent = self.canvas.selected_element.parent
+        selected = self.canvas.selected_element
+        if selected:
+            if selected.element_type == 'window':
+                parent = selected
+            elif selected.parent:
+                parent = selected.parent
         
         category = gui_info['category']
         name = self._get_next_name(category[:3])
@@ -983,7 +1284,7 @@ class GUIEditPanel(ttk.Frame):
             element.set_property('text', display_name)
         
         self.canvas.add_widget(element, parent)
-        self._sync_to_code()
+        self.schedule_sync()
         
         type_label = element_type if element_type != 'widget' else category
         self.info_var.set(f"Added {type_label} '{name}' to {parent.name}")
@@ -1005,12 +1306,18 @@ class GUIEditPanel(ttk.Frame):
     
     def load_from_code(self, code):
         """Load GUI elements from PyTML code"""
+        self._cancel_sync()  # The canvas is rebuilt from this code - drop stale syncs
+        # gui_blocks already match full_code (kept current by _sync_to_code) - the
+        # text widget hands the code back with a trailing newline added
+        blocks_current = code == self.full_code or code == self.full_code + '\n'
         self.full_code = code
+        self._code_lines = code.split('\n')  # Spliced in place by _sync_to_code
         self._updating_code = True
         
         try:
-            # Find all GUI blocks
-            self.gui_blocks = GUIBlock.find_all_blocks(code)
+            # Find all GUI blocks - only rescan code that changed outside the GUI editor
+            if not blocks_current:
+                self.gui_blocks = GUIBlock.find_all_blocks(code)
             self._update_block_combo()
             
             # Load first block if any
@@ -1029,18 +1336,21 @@ class GUIEditPanel(ttk.Frame):
         """Parse GUI content and create elements - fully dynamic from registry"""
         windows_by_name = {}
         
-        # Regex pattern that handles > inside quoted values: matches non-quote/non-> OR quoted strings
-        # This fixes parsing of attributes like: backgroundcolor="<bc_value>"
-        ATTR_PATTERN = r'(?:[^>"]*|"[^"]*")*'
+        # One scan of the content - tags come back in document order
+        tags = [(match.group(1), match.group(2)) for match in _TAG_RE.finditer(content)]
         
         # Parse windows (containers)
-        window_pattern = rf'<window\s+({ATTR_PATTERN})>'
-        for match in re.finditer(window_pattern, content):
-            attrs = self._parse_attributes(match.group(1))
+        tag_windows = []  # Window created for each tag, None for other tags
+        for tag, attr_string in tags:
+            if tag != 'window':
+                tag_windows.append(None)
+                continue
+            
+            attrs = self._parse_attributes(attr_string)
             name = attrs.get('name', self._get_next_name('wnd'))
             title = attrs.get('title', 'Window')
             
-            size_match = re.search(r'size="(\d+)"(?:,"(\d+)")?', match.group(1))
+            size_match = _SIZE_RE.search(attr_string)
             if size_match:
                 width = int(size_match.group(1))
                 height = int(size_match.group(2)) if size_match.group(2) else width
@@ -1057,64 +1367,55 @@ class GUIEditPanel(ttk.Frame):
             
             self.canvas.add_window(element)
             windows_by_name[name] = element
-        
-        # Build dynamic widget patterns from registry
-        # Get all widget categories from registry
-        widget_types = set()
-        for gui_info in self.registry.widgets:
-            category = gui_info.get('category', '')
-            if category:
-                widget_types.add(category)
-        
-        # Also check for any tags in the content that we might have missed
-        # Find all <tagname ...> patterns - use pattern that handles > in quotes
-        all_tags = set(re.findall(rf'<(\w+)\s+{ATTR_PATTERN}>', content))
-        all_tags.discard('window')  # Already handled
-        all_tags.discard('gui')     # Container tag, not widget
-        
-        # Combine registry widgets + found tags
-        widget_types.update(all_tags)
-        
-        # Parse each widget type dynamically
-        for widget_type in widget_types:
+            tag_windows.append(element)
+        
+        # Parse widgets - any other tag, looked up in the registry for defaults
+        current_window = None  # Nearest window above the widget in the code
+        widgets_by_window = {}  # id(window) -> (window, widgets) - added per window afterwards
+        first_window = next(iter(windows_by_name.values()), None)  # For widgets above all windows
+        for (widget_type, attr_string), window in zip(tags, tag_windows):
+            if window is not None:
+                current_window = window
+                continue
+            if widget_type == 'gui':  # Container tag, not widget
+                continue
+            
             # Get gui_info from registry for default size
             gui_info = self.registry.get_by_category(widget_type) or {}
             default_size = gui_info.get('default_size', (100, 30))
             
-            # Use ATTR_PATTERN to handle > inside quoted values
-            pattern = rf'<{widget_type}\s+({ATTR_PATTERN})>'
-            for match in re.finditer(pattern, content):
-                attrs = self._parse_attributes(match.group(1))
-                name = attrs.get('name', self._get_next_name(widget_type[:3]))
-                text = attrs.get('text', gui_info.get('display_name', widget_type.title()))
-                x = int(attrs.get('x', 10))
-                y = int(attrs.get('y', 10))
-                parent_name = attrs.get('parent')
-                
-                # Get width/height from attrs or default_size
-                width = int(attrs.get('width', default_size[0]))
-                height = int(attrs.get('height', default_size[1]))
-                
-                parent = None
-                if parent_name and parent_name in windows_by_name:
-                    parent = windows_by_name[parent_name]
-                elif windows_by_name:
-                    parent = list(windows_by_name.values())[0]
-                
-                element = GUIElement(widget_type, name, x, y, width, height)
-                element.set_property('text', text)
-                
-                # Store ALL parsed attributes - preserve colors, etc.
-                for attr_name, attr_value in attrs.items():
-                    if attr_name not in ('name', 'text', 'x', 'y', 'parent', 'width', 'height'):
-                        element.set_property(attr_name, attr_value)
-                
-                if parent:
-                    self.canvas.add_widget(element, parent)
+            attrs = self._parse_attributes(attr_string)
+            name = attrs.get('name', self._get_next_name(widget_type[:3]))
+            text = attrs.get('text', gui_info.get('display_name', widget_type.title()))
+            x = int(attrs.get('x', 10))
+            y = int(attrs.get('y', 10))
+            parent_name = attrs.get('parent')
+            
+            # Get width/height from attrs or default_size
+            width = int(attrs.get('width', default_size[0]))
+            height = int(attrs.get('height', default_size[1]))
+            
+            parent = windows_by_name.get(parent_name) if parent_name else None
+            if parent is None:
+                parent = current_window or first_window
+            
+            element = GUIElement(widget_type, name, x, y, width, height)
+            element.set_property('text', text)
+            
+            # Store ALL parsed attributes - preserve colors, etc.
+            for attr_name, attr_value in attrs.items():
+                if attr_name not in ('name', 'text', 'x', 'y', 'parent', 'width', 'height'):
+                    element.set_property(attr_name, attr_value)
+            
+            if parent:
+                widgets_by_window.setdefault(id(parent), (parent, []))[1].append(element)
+        
+        for parent, widgets in widgets_by_window.values():
+            self.canvas.add_widgets(widgets, parent)
     
     def _parse_attributes(self, attr_string):
         attrs = {}
-        for match in re.finditer(r'(\w+)="([^"]*)"', attr_string):
+        for match in _ATTR_RE.finditer(attr_string):
             attrs[match.group(1)] = match.group(2)
         return attrs
 
@@ -1135,4 +1436,4 @@ def get_plugin_info():
     }
 
 
-__all__ = ['GUINodeRegistry', 'GUIElement', 'GUICanvas', 'GUIEditPanel', 'GUIBlock', 'get_plugin_info']
+__all__ = ['GUINodeRegistry', 'get_default_registry', 'GUIElement', 'GUICanvas', 'GUIEditPanel', 'GUIBlock', 'get_plugin_info']
@@ -10,15 +10,111 @@ import sys
 import inspect
 import re
 import importlib.util
-import glob
+import threading
+import queue
+import types
+import functools
+import weakref
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+# inspect is slow - class details and signatures are cached per class/function object.
+# Libs share imported classes (ActionNode etc.), and those stay cached across refreshes.
+_CLASS_DETAILS_CACHE = weakref.WeakKeyDictionary()  # cls -> (properties, signature)
+_CLASS_METHODS_CACHE = weakref.WeakKeyDictionary()  # cls -> method dicts
+_SIGNATURE_CACHE = weakref.WeakKeyDictionary()  # function -> inspect.Signature
+
+# Regex -> readable syntax substitutions for _pattern_to_syntax, applied in order
+_SYNTAX_SUBS = [(re.compile(pattern), repl) for pattern, repl in (
+    (r'\(\?:([^)]+)\)', r'\1'),  # Non-capturing groups
+    (r'\(\\w\+\)', 'name'),
+    (r'\(\\d\+\)', 'number'),
+    (r'\(\[\^"\]\*\)', 'value'),
+    (r'\(\.\+\?\)', '...'),
+    (r'\\s\+', ' '),
+    (r'\\s\*', ''),
+    (r'\\s', ' '),
+    (r'\?', ''),
+)]
+
+
+def _cached_signature(func):
+    """inspect.signature(func), cached for functions that can be weakly referenced"""
+    try:
+        return _SIGNATURE_CACHE[func]
+    except (KeyError, TypeError):
+        pass
+    sig = inspect.signature(func)
+    try:
+        _SIGNATURE_CACHE[func] = sig
+    except TypeError:
+        pass  # Builtins (e.g. object.__init__) can't be weakly referenced
+    return sig
+
+
+def _class_functions(cls):
+    """Same as inspect.getmembers(cls, inspect.isfunction), without getattr on every name"""
+    if type(cls).__dir__ is not type.__dir__:
+        return inspect.getmembers(cls, inspect.isfunction)  # Metaclass decides what dir() shows
+    
+    members = {}
+    for klass in reversed(cls.__mro__):
+        members.update(vars(klass))  # Subclasses override their bases
+    
+    functions = []
+    for name, value in members.items():
+        if isinstance(value, staticmethod):
+            value = value.__func__
+        if isinstance(value, types.FunctionType):
+            functions.append((name, value))
+    functions.sort(key=lambda item: item[0])
+    return functions
+
+
+@functools.lru_cache(maxsize=256)
+def _syntax_example(class_name, prop_names):
+    """Syntax example for a class name and its property names - many classes share the same shape"""
+    name_lower = class_name.lower().replace('node', '').replace('action', '')
+    
+    if not name_lower:
+        return ""
+    
+    # Build attributes
+    attrs = [f'{name}="..."' for name in prop_names
+             if name not in ('tag_name', 'attributes', 'children', 'parent')]
+    
+    if attrs:
+        return f'<{name_lower} {" ".join(attrs)}>'
+    return f'<{name_lower}>'
+
+
+def _class_methods(cls):
+    """Method dicts (name, signature, description) for the public methods of a class"""
+    methods = _CLASS_METHODS_CACHE.get(cls)
+    if methods is None:
+        methods = []
+        for method_name, method in _class_functions(cls):
+            if method_name.startswith('_'):
+                continue
+            try:
+                sig = str(_cached_signature(method))
+                doc = method.__doc__ or ""
+                description = doc.split('\n')[0] if doc else ""
+            except:
+                sig, description = "()", ""
+            methods.append(ObjectMethod(method_name, sig, description))
+        _CLASS_METHODS_CACHE[cls] = methods
+    return methods
+
+
 class ObjectInfo:
     """Information about a PyTML object"""
     
+    __slots__ = ('name', 'obj_type', 'module', 'description', 'syntax', 'properties',
+                 '_methods', '_methods_from', 'signature', 'key', 'search_text', 'syntax_short')
+    
     def __init__(self, name, obj_type, module, description=""):
         self.name = name
         self.obj_type = obj_type  # 'node', 'class', 'function', 'parser'
@@ -26,24 +122,50 @@ class ObjectInfo:
         self.description = description
         self.syntax = ""
         self.properties = []
-        self.methods = []
+        self._methods = []
+        self._methods_from = None  # Class whose methods are inspected on first use of .methods
         self.signature = ""
+        self.key = None  # Key in ObjectLibrary.objects
+        self.search_text = ""  # Lowercased name/description/syntax, set by ObjectLibrary
+        self.syntax_short = ""  # Syntax truncated for the tree, set by ObjectLibrary
+    
+    @property
+    def methods(self):
+        """Public methods - a class's methods are only inspected when first needed"""
+        if self._methods_from is not None:
+            cls, self._methods_from = self._methods_from, None
+            self._methods.extend(_class_methods(cls))
+        return self._methods
     
     def add_property(self, name, prop_type, description=""):
         """Add a property"""
-        self.properties.append({
-            'name': name,
-            'type': prop_type,
-            'description': description
-        })
+        self.properties.append(ObjectProperty(name, prop_type, description))
     
     def add_method(self, name, signature, description=""):
         """Add a method"""
-        self.methods.append({
-            'name': name,
-            'signature': signature,
-            'description': description
-        })
+        self._methods.append(ObjectMethod(name, signature, description))
+
+
+class ObjectProperty:
+    """A constructor parameter of a PyTML object"""
+    
+    __slots__ = ('name', 'type', 'description')
+    
+    def __init__(self, name, prop_type, description=""):
+        self.name = name
+        self.type = prop_type
+        self.description = description
+
+
+class ObjectMethod:
+    """A public method of a PyTML object"""
+    
+    __slots__ = ('name', 'signature', 'description')
+    
+    def __init__(self, name, signature, description=""):
+        self.name = name
+        self.signature = signature
+        self.description = description
 
 
 class ObjectLibrary:
@@ -53,6 +175,7 @@ class ObjectLibrary:
         self.objects = {}
         self.categories = {}
         self.parsers = []  # List of (pattern, syntax_example)
+        self._file_cache = {}  # filepath -> (st_mtime_ns, classes, parsers)
     
     def load_from_libs(self):
         """Load all objects dynamically from lib files"""
@@ -62,64 +185,107 @@ class ObjectLibrary:
         
         libs_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'libs')
         
-        # Find all python files in libs folder
-        for lib_file in glob.glob(os.path.join(libs_path, '*.py')):
-            if lib_file.endswith('__init__.py'):
-                continue
-            self._load_lib_file(lib_file)
+        # Find all python files in libs folder (dirent types - no stat per file)
+        with os.scandir(libs_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith('.py') and name != '__init__.py' and not name.startswith('.') and entry.is_file():
+                    # On Windows the directory listing already carries the stat data
+                    try:
+                        mtime = entry.stat().st_mtime_ns
+                    except OSError:
+                        mtime = None
+                    self._load_lib_file(entry.path, mtime)
         
         # Load from Compiler.py
         self._load_compiler_objects()
+        
+        # Lowercased search text and tree syntax - built once per load instead of per keystroke/repaint
+        for obj in self.objects.values():
+            obj.search_text = f"{obj.name}\n{obj.description}\n{obj.syntax}".lower()
+            obj.syntax_short = obj.syntax[:40] + '...' if len(obj.syntax) > 40 else obj.syntax
     
-    def _load_lib_file(self, filepath):
-        """Load objects from a single lib file"""
+    def _cached_file_entries(self, filepath, mtime=None):
+        """Cached (classes, parsers) for a file, or None if it changed since it was read"""
+        if mtime is None:
+            try:
+                mtime = os.stat(filepath).st_mtime_ns
+            except OSError:
+                return None, None
+        cached = self._file_cache.get(filepath)
+        if cached is not None and cached[0] == mtime:
+            return mtime, cached[1:]
+        return mtime, None
+    
+    def _load_lib_file(self, filepath, mtime=None):
+        """Load objects from a single lib file (mtime in ns, if the caller already has it)"""
         module_name = os.path.basename(filepath)[:-3]  # Remove .py
         category = module_name.replace('_', ' ').title()
         
         if category not in self.categories:
             self.categories[category] = []
         
-        try:
-            # Dynamic import
-            spec = importlib.util.spec_from_file_location(module_name, filepath)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+        # Unchanged since the last load - reuse the objects instead of re-importing
+        mtime, entries = self._cached_file_entries(filepath, mtime)
+        if entries is None:
+            try:
+                entries = self._read_lib_file(filepath, module_name)
+            except Exception as e:
+                print(f"Could not load {filepath}: {e}")
+                return
+            if mtime is not None:
+                self._file_cache[filepath] = (mtime, *entries)
+        
+        classes, parsers = entries
+        for info in classes:
+            self.objects[info.key] = info
+            self.categories[category].append(info)
+        
+        for pattern, parser_info in parsers:
+            self.parsers.append((pattern, parser_info.syntax))
             
-            # Find all classes
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if name.startswith('_'):
-                    continue
-                
-                # Skip ActionNode base class (duplicated in each file)
-                if name == 'ActionNode' and module_name != 'compiler':
-                    continue
-                
-                info = self._extract_class_info(name, obj, module_name, filepath)
-                if info:
-                    self.objects[f"{module_name}.{name}"] = info
-                    self.categories[category].append(info)
+            # Add as object
+            key = f"{module_name}.parser.{len(self.parsers)}"
+            parser_info.key = key
+            self.objects[key] = parser_info
+            self.categories[category].append(parser_info)
+    
+    def _read_lib_file(self, filepath, module_name):
+        """Import a lib file and extract its classes and line parsers"""
+        classes = []
+        parsers = []  # List of (pattern, ObjectInfo)
+        
+        # Dynamic import
+        module = self._import_file(module_name, filepath, f"libs.{module_name}")
+        
+        # Find all classes
+        for name, obj in inspect.getmembers(module, inspect.isclass):
+            if name.startswith('_'):
+                continue
             
-            # Find line parsers if they exist
-            if hasattr(module, 'get_line_parsers'):
-                parsers = module.get_line_parsers()
-                for pattern, handler in parsers:
-                    syntax = self._pattern_to_syntax(pattern)
-                    parser_info = ObjectInfo(
-                        name=syntax,
-                        obj_type='syntax',
-                        module=module_name,
-                        description=handler.__doc__ or f"Parser from {module_name}"
-                    )
-                    parser_info.syntax = syntax
-                    self.parsers.append((pattern, syntax))
-                    
-                    # Add as object
-                    key = f"{module_name}.parser.{len(self.parsers)}"
-                    self.objects[key] = parser_info
-                    self.categories[category].append(parser_info)
-                    
-        except Exception as e:
-            print(f"Could not load {filepath}: {e}")
+            # Skip ActionNode base class (duplicated in each file)
+            if name == 'ActionNode' and module_name != 'compiler':
+                continue
+            
+            info = self._extract_class_info(name, obj, module_name, filepath)
+            if info:
+                info.key = f"{module_name}.{name}"
+                classes.append(info)
+        
+        # Find line parsers if they exist
+        if hasattr(module, 'get_line_parsers'):
+            for pattern, handler in module.get_line_parsers():
+                syntax = self._pattern_to_syntax(pattern)
+                parser_info = ObjectInfo(
+                    name=syntax,
+                    obj_type='syntax',
+                    module=module_name,
+                    description=handler.__doc__ or f"Parser from {module_name}"
+                )
+                parser_info.syntax = syntax
+                parsers.append((pattern, parser_info))
+        
+        return classes, parsers
     
     def _load_compiler_objects(self):
         """Load objects from Compiler.py"""
@@ -128,22 +294,51 @@ class ObjectLibrary:
         if 'Control Flow' not in self.categories:
             self.categories['Control Flow'] = []
         
-        try:
-            spec = importlib.util.spec_from_file_location('Compiler', compiler_path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            
-            # Find node classes
-            for name in ['ActionNode', 'BlockNode', 'IfNode', 'LoopNode']:
-                if hasattr(module, name):
-                    obj = getattr(module, name)
-                    info = self._extract_class_info(name, obj, 'Compiler', compiler_path)
-                    if info:
-                        self.objects[f"Compiler.{name}"] = info
-                        self.categories['Control Flow'].append(info)
-                        
-        except Exception as e:
-            print(f"Could not load Compiler.py: {e}")
+        mtime, entries = self._cached_file_entries(compiler_path)
+        if entries is None:
+            classes = []
+            try:
+                module = self._import_file('Compiler', compiler_path, 'Compiler')
+                
+                # Find node classes
+                for name in ['ActionNode', 'BlockNode', 'IfNode', 'LoopNode']:
+                    if hasattr(module, name):
+                        obj = getattr(module, name)
+                        info = self._extract_class_info(name, obj, 'Compiler', compiler_path)
+                        if info:
+                            info.key = f"Compiler.{name}"
+                            classes.append(info)
+                            
+            except Exception as e:
+                print(f"Could not load Compiler.py: {e}")
+                return
+            entries = (classes, [])
+            if mtime is not None:
+                self._file_cache[compiler_path] = (mtime, *entries)
+        
+        for info in entries[0]:
+            self.objects[info.key] = info
+            self.categories['Control Flow'].append(info)
+    
+    def _import_file(self, module_name, filepath, imported_name):
+        """Module for a file - a normal (sys.modules cached) import on first load"""
+        # Only before this library has read the file: once it has, a cache miss
+        # means the file changed and the sys.modules copy is stale
+        if filepath not in self._file_cache:
+            try:
+                module = importlib.import_module(imported_name)
+            except ImportError:
+                module = None
+            module_file = getattr(module, '__file__', None)
+            if module_file and os.path.normcase(os.path.abspath(module_file)) == os.path.normcase(os.path.abspath(filepath)):
+                return module
+        
+        # Changed on disk (or shadowed by another module) - run a private copy,
+        # the app's own module is left untouched
+        spec = importlib.util.spec_from_file_location(module_name, filepath)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
     
     def _extract_class_info(self, name, cls, module_name, filepath):
         """Extract information from a class"""
@@ -154,9 +349,40 @@ class ObjectLibrary:
             description=cls.__doc__ or f"Class from {module_name}"
         )
         
+        details = _CLASS_DETAILS_CACHE.get(cls)
+        if details is None:
+            details = self._extract_class_details(cls)
+            _CLASS_DETAILS_CACHE[cls] = details
+        properties, signature = details
+        info.properties = list(properties)
+        info.signature = signature
+        info._methods_from = cls  # Not shown in the tree - inspected on demand
+        
+        # Generate syntax example based on class name
+        info.syntax = self._generate_syntax_example(name, info.properties)
+        
+        return info
+    
+    def _extract_class_details(self, cls):
+        """Properties and signature of a class from its __init__"""
+        details = ObjectInfo(cls.__name__, 'class', cls.__module__)
+        
         # Extract properties from __init__
+        init = cls.__init__
+        code = getattr(init, '__code__', None)
+        if (code is not None and not hasattr(init, '__wrapped__') and code.co_argcount
+                and code.co_varnames[0] == 'self' and not code.co_kwonlyargcount
+                and not code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)):
+            # Plain positional __init__ - names straight from the code object, no Signature
+            params = code.co_varnames[1:code.co_argcount]
+            annotations = getattr(init, '__annotations__', None) or {}
+            for param_name in params:
+                details.add_property(param_name, str(annotations.get(param_name, 'any')))
+            details.signature = f"({', '.join(params)})"
+            return details.properties, details.signature
+        
         try:
-            init_sig = inspect.signature(cls.__init__)
+            init_sig = _cached_signature(init)
             params = []
             for param_name, param in init_sig.parameters.items():
                 if param_name == 'self':
@@ -164,59 +390,25 @@ class ObjectLibrary:
                 param_type = 'any'
                 if param.annotation != inspect.Parameter.empty:
                     param_type = str(param.annotation)
-                info.add_property(param_name, param_type)
+                details.add_property(param_name, param_type)
                 params.append(param_name)
-            info.signature = f"({', '.join(params)})"
+            details.signature = f"({', '.join(params)})"
         except:
             pass
         
-        # Extract methods
-        for method_name, method in inspect.getmembers(cls, predicate=inspect.isfunction):
-            if method_name.startswith('_'):
-                continue
-            try:
-                sig = str(inspect.signature(method))
-                doc = method.__doc__ or ""
-                info.add_method(method_name, sig, doc.split('\n')[0] if doc else "")
-            except:
-                info.add_method(method_name, "()", "")
-        
-        # Generate syntax example based on class name
-        info.syntax = self._generate_syntax_example(name, info.properties)
-        
-        return info
+        return details.properties, details.signature
     
     def _pattern_to_syntax(self, pattern):
         """Convert regex pattern to readable syntax"""
         # Replace regex groups with placeholders
         syntax = pattern
-        syntax = re.sub(r'\(\?:([^)]+)\)', r'\1', syntax)  # Non-capturing groups
-        syntax = re.sub(r'\(\\w\+\)', 'name', syntax)
-        syntax = re.sub(r'\(\\d\+\)', 'number', syntax)
-        syntax = re.sub(r'\(\[\^"\]\*\)', 'value', syntax)
-        syntax = re.sub(r'\(\.\+\?\)', '...', syntax)
-        syntax = re.sub(r'\\s\+', ' ', syntax)
-        syntax = re.sub(r'\\s\*', '', syntax)
-        syntax = re.sub(r'\?', '', syntax)
+        for regex, repl in _SYNTAX_SUBS:
+            syntax = regex.sub(repl, syntax)
         return syntax
     
     def _generate_syntax_example(self, class_name, properties):
         """Generate syntax example based on class"""
-        name_lower = class_name.lower().replace('node', '').replace('action', '')
-        
-        if not name_lower:
-            return ""
-        
-        # Build attributes
-        attrs = []
-        for prop in properties:
-            if prop['name'] in ('tag_name', 'attributes', 'children', 'parent'):
-                continue
-            attrs.append(f'{prop["name"]}="..."')
-        
-        if attrs:
-            return f'<{name_lower} {" ".join(attrs)}>'
-        return f'<{name_lower}>'
+        return _syntax_example(class_name, tuple(prop.name for prop in properties))
     
     def get_by_category(self, category):
         """Get objects in a category"""
@@ -226,29 +418,23 @@ class ObjectLibrary:
         """Get all objects"""
         return list(self.objects.values())
     
+    def iter_syntax_objects(self):
+        """Iterate objects that have a syntax example, without building dicts"""
+        return (obj for obj in self.objects.values() if obj.syntax)
+    
     def get_all_syntax(self):
         """Get all syntax examples"""
-        syntax_list = []
-        for obj in self.objects.values():
-            if obj.syntax:
-                syntax_list.append({
-                    'syntax': obj.syntax,
-                    'name': obj.name,
-                    'module': obj.module,
-                    'description': obj.description
-                })
-        return syntax_list
+        return [{
+            'syntax': obj.syntax,
+            'name': obj.name,
+            'module': obj.module,
+            'description': obj.description
+        } for obj in self.iter_syntax_objects()]
     
     def search(self, query):
         """Search for objects"""
         query = query.lower()
-        results = []
-        for obj in self.objects.values():
-            if (query in obj.name.lower() or 
-                query in obj.description.lower() or
-                query in obj.syntax.lower()):
-                results.append(obj)
-        return results
+        return [obj for obj in self.objects.values() if query in obj.search_text]
 
 
 class ObjectsPanel(ttk.Frame):
@@ -257,9 +443,14 @@ class ObjectsPanel(ttk.Frame):
     def __init__(self, parent, editor_callback=None):
         super().__init__(parent)
         self.editor_callback = editor_callback  # Callback to insert code in editor
+        self._search_after_id = None  # Pending debounced search
+        self._load_queue = queue.Queue()  # Worker thread -> Tk thread: load finished
+        self._loading = False
+        self._load_started = False  # Libs are loaded when the panel is first shown
+        self._object_rows = set()  # Object iids created since the last load
+        self._category_rows = {}  # Category iid -> True once its objects are inserted
         
         self.library = ObjectLibrary()
-        self.library.load_from_libs()
         
         self._setup_ui()
     
@@ -271,7 +462,7 @@ class ObjectsPanel(ttk.Frame):
         
         ttk.Label(search_frame, text="🔍").pack(side=tk.LEFT)
         self.search_var = tk.StringVar()
-        self.search_var.trace('w', self._on_search)
+        self.search_var.trace_add('write', self._on_search)
         self.search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
         self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
         
@@ -304,6 +495,7 @@ class ObjectsPanel(ttk.Frame):
         # Double-click to insert
         self.tree.bind('<Double-1>', self._on_double_click)
         self.tree.bind('<<TreeviewSelect>>', self._on_select)
+        self.tree.bind('<<TreeviewOpen>>', self._on_tree_open)
         
         # Info panel
         self.info_text = tk.Text(self, height=4, wrap=tk.WORD, bg='#2d2d2d', fg='#d4d4d4')
@@ -312,40 +504,116 @@ class ObjectsPanel(ttk.Frame):
         # Insert button
         ttk.Button(self, text="📥 Insert in Editor", command=self._insert_selected).pack(pady=5)
         
-        # Load objects
-        self._populate_tree()
+        # Load objects once the panel is actually shown
+        self.bind('<Map>', self._on_first_map)
+    
+    def _on_first_map(self, event):
+        """Start loading the first time the panel becomes visible"""
+        if event.widget is self and not self._load_started:
+            self._start_load()
     
     def _refresh(self):
         """Reload objects from libs"""
-        self.library.load_from_libs()
-        self._populate_tree()
+        self._start_load()
+    
+    def _start_load(self):
+        """Load the library on a worker thread so the UI stays responsive"""
+        if self._loading:
+            return
+        self._loading = True
+        self._load_started = True
+        self._clear_tree()
+        self.tree.insert('', 'end', iid='__loading__', text="⏳ Loading...")
+        threading.Thread(target=self._load_worker, daemon=True).start()
+        self.after(50, self._poll_load)
+    
+    def _load_worker(self):
+        """Worker thread - no Tk calls here"""
+        try:
+            self.library.load_from_libs()
+        except Exception as e:
+            print(f"Could not load objects: {e}")
+        finally:
+            self._load_queue.put(True)
+    
+    def _poll_load(self):
+        """Fill the tree once the worker is done - Tk is only touched on its own thread"""
+        try:
+            self._load_queue.get_nowait()
+        except queue.Empty:
+            self.after(50, self._poll_load)
+            return
+        self._loading = False
+        self.tree.delete('__loading__')
+        self._run_search()  # Respects anything typed while loading
+    
+    def _clear_tree(self):
+        """Delete every row, attached or detached - needed when the library is reloaded"""
+        # Object rows first: once their category is gone they would no longer exist
+        self.tree.delete(*self._object_rows)
+        self.tree.delete(*self._category_rows)
+        self._object_rows.clear()
+        self._category_rows.clear()
     
     def _populate_tree(self, objects=None):
-        """Fill tree with objects"""
-        # Clear existing
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        if objects is None:
-            # Show by category
-            for category, objs in sorted(self.library.categories.items()):
-                if objs:
-                    cat_id = self.tree.insert('', 'end', text=f"📁 {category}", open=False)
-                    for obj in objs:
-                        syntax_short = obj.syntax[:40] + '...' if len(obj.syntax) > 40 else obj.syntax
-                        self.tree.insert(cat_id, 'end', text=obj.name, 
-                                        values=(obj.obj_type, syntax_short),
-                                        tags=(obj.name,))
-        else:
+        """Fill tree with objects - rows are created once per load, then detached and moved"""
+        # Detach instead of delete, so the rows can be reused by the next search
+        self.tree.detach(*self.tree.get_children())
+        
+        if objects is not None:
             # Show search results
-            for obj in objects:
-                syntax_short = obj.syntax[:40] + '...' if len(obj.syntax) > 40 else obj.syntax
-                self.tree.insert('', 'end', text=obj.name,
-                                values=(obj.obj_type, syntax_short),
-                                tags=(obj.name,))
+            self._place_objects('', objects)
+            return
+        
+        # Show by category - collapsed categories only get a placeholder child,
+        # their objects are inserted the first time they are opened
+        insert = self.tree.insert
+        for category, objs in sorted(self.library.categories.items()):
+            if not objs:
+                continue
+            cat_id = f"cat:{category}"
+            filled = self._category_rows.get(cat_id)
+            if filled is None:
+                insert('', 'end', iid=cat_id, text=f"📁 {category}", open=False)
+                insert(cat_id, 'end', iid=f"{cat_id}:__loading__", text="⏳ Loading...")
+                self._category_rows[cat_id] = False
+            else:
+                self.tree.move(cat_id, '', 'end')
+                if filled:
+                    self._place_objects(cat_id, objs)  # Take back rows a search moved away
+    
+    def _place_objects(self, parent, objects):
+        """Put object rows under parent in order - the iid is the ObjectLibrary.objects key"""
+        # Existing rows are moved, only missing ones are created
+        rows = self._object_rows
+        insert = self.tree.insert
+        move = self.tree.move
+        for obj in objects:
+            if obj.key in rows:
+                move(obj.key, parent, 'end')
+            else:
+                insert(parent, 'end', iid=obj.key, text=obj.name, values=(obj.obj_type, obj.syntax_short))
+                rows.add(obj.key)
+    
+    def _on_tree_open(self, event):
+        """Fill a category with its objects the first time it is opened"""
+        cat_id = self.tree.focus()
+        if self._category_rows.get(cat_id) is not False:
+            return
+        self.tree.delete(f"{cat_id}:__loading__")
+        self._category_rows[cat_id] = True
+        self._place_objects(cat_id, self.library.categories.get(cat_id[4:], ()))
     
     def _on_search(self, *args):
-        """Handle search"""
+        """Handle search - typing a word runs one search, not one per character"""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(150, self._run_search)
+    
+    def _run_search(self):
+        self._search_after_id = None
+        if self._loading:
+            return  # The tree is filled when loading finishes
         query = self.search_var.get()
         if query:
             results = self.library.search(query)
@@ -359,27 +627,24 @@ class ObjectsPanel(ttk.Frame):
         if not selection:
             return
         
-        item = selection[0]
-        item_text = self.tree.item(item, 'text')
-        
-        # Find the object
-        for obj in self.library.objects.values():
-            if obj.name == item_text:
-                self._show_info(obj)
-                break
+        obj = self._get_item_object(selection[0])
+        if obj:
+            self._show_info(obj)
+    
+    def _get_item_object(self, item):
+        """Object for a tree item - object rows use their ObjectLibrary.objects key as iid"""
+        return self.library.objects.get(item)  # None for category rows
     
     def _show_info(self, obj):
         """Show information about an object"""
-        self.info_text.delete('1.0', tk.END)
-        
-        info = f"📦 {obj.name} ({obj.obj_type})\n"
-        info += f"📁 Module: {obj.module}\n"
+        parts = [f"📦 {obj.name} ({obj.obj_type})", f"📁 Module: {obj.module}"]
         if obj.description:
-            info += f"📝 {obj.description}\n"
+            parts.append(f"📝 {obj.description}")
         if obj.syntax:
-            info += f"💻 Syntax: {obj.syntax}"
+            parts.append(f"💻 Syntax: {obj.syntax}")
         
-        self.info_text.insert('1.0', info)
+        self.info_text.delete('1.0', tk.END)
+        self.info_text.insert('1.0', '\n'.join(parts))
     
     def _on_double_click(self, event):
         """Handle double-click"""
@@ -391,15 +656,9 @@ class ObjectsPanel(ttk.Frame):
         if not selection:
             return
         
-        item = selection[0]
-        item_text = self.tree.item(item, 'text')
-        
-        # Find the object
-        for obj in self.library.objects.values():
-            if obj.name == item_text and obj.syntax:
-                if self.editor_callback:
-                    self.editor_callback(obj.syntax)
-                break
+        obj = self._get_item_object(selection[0])
+        if obj and obj.syntax and self.editor_callback:
+            self.editor_callback(obj.syntax)
 
 
 def get_plugin_info():
@@ -419,4 +678,4 @@ def get_plugin_info():
 
 
 # Export
-__all__ = ['ObjectInfo', 'ObjectLibrary', 'ObjectsPanel', 'get_plugin_info']
+__all__ = ['ObjectInfo', 'ObjectProperty', 'ObjectMethod', 'ObjectLibrary', 'ObjectsPanel', 'get_plugin_info']
@@ -491,6 +491,9 @@ class ElementProperties:
 class PropertiesPanel(ttk.Frame):
     """Panel showing properties for selected element - dynamic"""
     
+    # GUIElement geometry attributes and their value when the field is empty
+    _GEOMETRY_DEFAULTS = {'x': 0, 'y': 0, 'width': 100, 'height': 30}
+    
     def __init__(self, parent, on_property_change=None):
         super().__init__(parent)
         self.on_property_change = on_property_change
@@ -587,27 +590,46 @@ class PropertiesPanel(ttk.Frame):
             self._create_group(group)
     
     def _sync_to_gui_element(self, prop):
-        """Sync a property change back to the GUIElement (if present)"""
+        """Sync a property change back to the GUIElement (if present)
+        
+        Returns False when the GUIElement already had this value, so the
+        change callback (redraw + code sync) can be skipped.
+        """
         if not self.current_element:
-            return
+            return True
         gui_elem = getattr(self.current_element, '_gui_element', None)
         if not gui_elem:
-            return
+            return True
         
         # Handle special position/size properties
-        if prop.name == 'x':
-            gui_elem.x = int(prop.value) if prop.value else 0
-        elif prop.name == 'y':
-            gui_elem.y = int(prop.value) if prop.value else 0
-        elif prop.name == 'width':
-            gui_elem.width = int(prop.value) if prop.value else 100
-        elif prop.name == 'height':
-            gui_elem.height = int(prop.value) if prop.value else 30
+        if prop.name in self._GEOMETRY_DEFAULTS:
+            value = int(prop.value) if prop.value else self._GEOMETRY_DEFAULTS[prop.name]
         elif prop.name == 'name':
-            gui_elem.name = str(prop.value) if prop.value else ''
+            value = str(prop.value) if prop.value else ''
         else:
             # Store in properties dict
+            if prop.name in gui_elem.properties and gui_elem.properties[prop.name] == prop.value:
+                return False
             gui_elem.set_property(prop.name, prop.value)
+            return True
+        
+        if getattr(gui_elem, prop.name) == value:
+            return False
+        setattr(gui_elem, prop.name, value)
+        return True
+    
+    def set_property_value(self, prop, value):
+        """Set a property and its widget without triggering a change callback
+        
+        Used when the editor rejects a change (e.g. a rename to a taken name)
+        and the field has to show the value that is actually in effect.
+        """
+        prop.set_value(value)
+        widget = self.property_widgets.get(prop.name)
+        var = getattr(widget, 'var', None)
+        if var is not None and var.get() != value:
+            # The trace sees the GUIElement already has this value and stays quiet
+            var.set(value)
     
     def load_from_line(self, line):
         """Parse a line and show properties"""
@@ -645,7 +667,7 @@ class PropertiesPanel(ttk.Frame):
             
             widget = ttk.Entry(frame, textvariable=var)
             widget.var = var
-            var.trace('w', lambda *args, p=prop, v=var: self._on_var_ref_change(p, v))
+            var.trace_add('write', lambda *args, p=prop, v=var: self._on_var_ref_change(p, v))
             
             # For var_color, try to show a preview with resolved value
             if prop.prop_type == 'var_color':
@@ -662,13 +684,13 @@ class PropertiesPanel(ttk.Frame):
             var = tk.BooleanVar(value=bool(prop.value))
             widget = ttk.Checkbutton(frame, variable=var)
             widget.var = var
-            var.trace('w', lambda *args, p=prop, v=var: self._on_bool_change(p, v))
+            var.trace_add('write', lambda *args, p=prop, v=var: self._on_bool_change(p, v))
         
         elif prop.prop_type == 'int':
             var = tk.StringVar(value=str(prop.value) if prop.value else "0")
             widget = ttk.Spinbox(frame, from_=0, to=9999, textvariable=var, width=10)
             widget.var = var
-            var.trace('w', lambda *args, p=prop, v=var: self._on_int_change(p, v))
+            var.trace_add('write', lambda *args, p=prop, v=var: self._on_int_change(p, v))
         
         elif prop.prop_type == 'stack' or prop.prop_type == 'list':
             # For stack/list, show as comma-separated
@@ -678,13 +700,13 @@ class PropertiesPanel(ttk.Frame):
             var = tk.StringVar(value=val if val else "")
             widget = ttk.Entry(frame, textvariable=var)
             widget.var = var
-            var.trace('w', lambda *args, p=prop, v=var: self._on_list_change(p, v))
+            var.trace_add('write', lambda *args, p=prop, v=var: self._on_list_change(p, v))
         
         elif prop.prop_type == 'color':
             var = tk.StringVar(value=prop.value if prop.value else "#ffffff")
             widget = ttk.Entry(frame, textvariable=var, width=12)
             widget.var = var
-            var.trace('w', lambda *args, p=prop, v=var: self._on_string_change(p, v))
+            var.trace_add('write', lambda *args, p=prop, v=var: self._on_string_change(p, v))
             
             # Color preview that acts as picker button
             try:
@@ -704,7 +726,7 @@ class PropertiesPanel(ttk.Frame):
             var = tk.StringVar(value=str(prop.value) if prop.value is not None else "")
             widget = ttk.Entry(frame, textvariable=var)
             widget.var = var
-            var.trace('w', lambda *args, p=prop, v=var: self._on_string_change(p, v))
+            var.trace_add('write', lambda *args, p=prop, v=var: self._on_string_change(p, v))
         
         widget.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
@@ -716,8 +738,7 @@ class PropertiesPanel(ttk.Frame):
     def _on_var_ref_change(self, prop, var):
         """Handle variable reference change - preserve as-is"""
         prop.set_value(var.get())
-        self._sync_to_gui_element(prop)
-        if self.on_property_change:
+        if self._sync_to_gui_element(prop) and self.on_property_change:
             self.on_property_change(self.current_element, prop)
     
     def _resolve_variable_color(self, value):
@@ -752,8 +773,7 @@ class PropertiesPanel(ttk.Frame):
     def _on_string_change(self, prop, var):
         """Handle string change"""
         prop.set_value(var.get())
-        self._sync_to_gui_element(prop)
-        if self.on_property_change:
+        if self._sync_to_gui_element(prop) and self.on_property_change:
             self.on_property_change(self.current_element, prop)
     
     def _on_int_change(self, prop, var):
@@ -762,15 +782,13 @@ class PropertiesPanel(ttk.Frame):
             prop.set_value(int(var.get()))
         except ValueError:
             pass
-        self._sync_to_gui_element(prop)
-        if self.on_property_change:
+        if self._sync_to_gui_element(prop) and self.on_property_change:
             self.on_property_change(self.current_element, prop)
     
     def _on_bool_change(self, prop, var):
         """Handle bool change"""
         prop.set_value(var.get())
-        self._sync_to_gui_element(prop)
-        if self.on_property_change:
+        if self._sync_to_gui_element(prop) and self.on_property_change:
             self.on_property_change(self.current_element, prop)
     
     def _on_list_change(self, prop, var):
@@ -788,8 +806,7 @@ class PropertiesPanel(ttk.Frame):
         else:
             prop.set_value([])
         
-        self._sync_to_gui_element(prop)
-        if self.on_property_change:
+        if self._sync_to_gui_element(prop) and self.on_property_change:
             self.on_property_change(self.current_element, prop)
     
     def _pick_color(self, var, preview_frame=None):